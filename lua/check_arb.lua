@@ -13,20 +13,31 @@ Usage from Python:
 ]]--
 
 -- Input parameters
-local pinnacle_key = KEYS[1]  -- e.g., "odds:pinnacle:nhl:12345:moneyline"
-local soft_key = KEYS[2]      -- e.g., "odds:bet365:nhl:12345:moneyline"
+local pinnacle_key = KEYS[1]  -- e.g., "odds:{12345}:pinnacle:moneyline"
+local soft_key = KEYS[2]      -- e.g., "odds:{12345}:soft:moneyline"
+-- {event_id} is a cluster hash tag: both keys share a slot, as Lua requires
 
 local home_odd = tonumber(ARGV[1])  -- New Pinnacle home odds (decimal, e.g., 2.15)
 local away_odd = tonumber(ARGV[2])  -- New Pinnacle away odds (decimal, e.g., 1.95)
 local draw_odd = tonumber(ARGV[3]) or 0  -- Optional draw odds (for 3-way markets)
 local timestamp = ARGV[4]             -- Unix timestamp of update
 local market_type = ARGV[5]           -- "moneyline", "puckline", "totals"
+local event_id = ARGV[6]              -- Event ID for the active_events index
+
+-- Reciprocals (1/odd) pre-computed in Python at ingest, so the arb check
+-- below is pure additions — no divisions inside single-threaded Redis
+local inv_home = tonumber(ARGV[7]) or 0
+local inv_away = tonumber(ARGV[8]) or 0
+local inv_draw = tonumber(ARGV[9]) or 0
 
 -- Step 1: Update Pinnacle odds in Redis (atomic write)
 redis.call('HSET', pinnacle_key,
     'home', home_odd,
     'away', away_odd,
     'draw', draw_odd,
+    'inv_home', inv_home,
+    'inv_away', inv_away,
+    'inv_draw', inv_draw,
     'timestamp', timestamp,
     'market_type', market_type
 )
@@ -34,6 +45,11 @@ redis.call('HSET', pinnacle_key,
 -- Set expiry (30 minutes) to auto-cleanup stale odds
 redis.call('EXPIRE', pinnacle_key, 1800)
 
+-- Maintain the active_events index so lookups avoid a full keyspace SCAN
+if event_id and event_id ~= '' then
+    redis.call('SADD', 'active_events', event_id)
+end
+
 -- Step 2: Retrieve cached soft book odds
 local soft_exists = redis.call('EXISTS', soft_key)
 
@@ -45,6 +61,9 @@ end
 local soft_home = tonumber(redis.call('HGET', soft_key, 'home'))
 local soft_away = tonumber(redis.call('HGET', soft_key, 'away'))
 local soft_draw = tonumber(redis.call('HGET', soft_key, 'draw')) or 0
+local inv_soft_home = tonumber(redis.call('HGET', soft_key, 'inv_home')) or 0
+local inv_soft_away = tonumber(redis.call('HGET', soft_key, 'inv_away')) or 0
+local inv_soft_draw = tonumber(redis.call('HGET', soft_key, 'inv_draw')) or 0
 local soft_timestamp = redis.call('HGET', soft_key, 'timestamp')
 
 -- Validate soft book odds aren't stale (> 60 seconds old)
@@ -57,81 +76,83 @@ if (current_time - soft_time) > 60 then
 end
 
 -- Step 3: Calculate arbitrage opportunities
--- Formula: Implied Probability Sum = (1/odd1) + (1/odd2) + ...
+-- Formula: Implied Probability Sum = inv_odd1 + inv_odd2 + ...
 -- Arbitrage exists if sum < 1.0 (< 100%)
-
-local arbs = {}  -- Array to store detected arbitrages
+-- Reciprocals are pre-computed, so each check is additions only
+--
+-- The best (highest-profit) arbitrage is tracked as a flat array so the
+-- script can return it without any cjson encoding; redis-py hands the
+-- array straight back as a Python list (no JSON parse on either side).
+-- Layout: {type, profit_pct, implied_prob,
+--          leg1_book, leg1_market, leg1_odd,
+--          leg2_book, leg2_market, leg2_odd[, leg3_odd]}
+
+local best = nil
+local best_profit = 0
 
 -- Scenario A: Pinnacle Home vs Soft Away
-if soft_away and soft_away > 0 then
-    local prob_a = (1 / home_odd) + (1 / soft_away)
+if inv_soft_away > 0 and inv_home > 0 then
+    local prob_a = inv_home + inv_soft_away
     if prob_a < 1.0 then
         local profit_pct = ((1 / prob_a) - 1) * 100
-        table.insert(arbs, {
-            type = "2-way",
-            leg1 = {book = "pinnacle", market = "home", odd = home_odd},
-            leg2 = {book = "soft", market = "away", odd = soft_away},
-            profit_pct = string.format("%.2f", profit_pct),
-            implied_prob = string.format("%.4f", prob_a)
-        })
+        if profit_pct > best_profit then
+            best_profit = profit_pct
+            best = {
+                '2-way',
+                string.format("%.2f", profit_pct),
+                string.format("%.4f", prob_a),
+                'pinnacle', 'home', tostring(home_odd),
+                'soft', 'away', tostring(soft_away)
+            }
+        end
     end
 end
 
 -- Scenario B: Pinnacle Away vs Soft Home
-if soft_home and soft_home > 0 then
-    local prob_b = (1 / away_odd) + (1 / soft_home)
+if inv_soft_home > 0 and inv_away > 0 then
+    local prob_b = inv_away + inv_soft_home
     if prob_b < 1.0 then
         local profit_pct = ((1 / prob_b) - 1) * 100
-        table.insert(arbs, {
-            type = "2-way",
-            leg1 = {book = "pinnacle", market = "away", odd = away_odd},
-            leg2 = {book = "soft", market = "home", odd = soft_home},
-            profit_pct = string.format("%.2f", profit_pct),
-            implied_prob = string.format("%.4f", prob_b)
-        })
+        if profit_pct > best_profit then
+            best_profit = profit_pct
+            best = {
+                '2-way',
+                string.format("%.2f", profit_pct),
+                string.format("%.4f", prob_b),
+                'pinnacle', 'away', tostring(away_odd),
+                'soft', 'home', tostring(soft_home)
+            }
+        end
     end
 end
 
 -- Scenario C: 3-way arbitrage (if draw odds exist)
-if draw_odd > 0 and soft_home and soft_away and soft_draw and soft_draw > 0 then
+if inv_draw > 0 and inv_soft_home > 0 and inv_soft_away > 0 and inv_soft_draw > 0 then
     -- Try all permutations of 3-way arbs
     local permutations = {
-        {home_odd, soft_away, soft_draw},  -- Pinny home, Soft away, Soft draw
-        {soft_home, away_odd, soft_draw},  -- Soft home, Pinny away, Soft draw
-        {soft_home, soft_away, draw_odd},  -- Soft home, Soft away, Pinny draw
+        {{inv_home, home_odd}, {inv_soft_away, soft_away}, {inv_soft_draw, soft_draw}},  -- Pinny home, Soft away, Soft draw
+        {{inv_soft_home, soft_home}, {inv_away, away_odd}, {inv_soft_draw, soft_draw}},  -- Soft home, Pinny away, Soft draw
+        {{inv_soft_home, soft_home}, {inv_soft_away, soft_away}, {inv_draw, draw_odd}},  -- Soft home, Soft away, Pinny draw
     }
 
-    for i, perm in ipairs(permutations) then
-        local prob_3way = (1 / perm[1]) + (1 / perm[2]) + (1 / perm[3])
+    for i, perm in ipairs(permutations) do
+        local prob_3way = perm[1][1] + perm[2][1] + perm[3][1]
         if prob_3way < 1.0 then
             local profit_pct = ((1 / prob_3way) - 1) * 100
-            table.insert(arbs, {
-                type = "3-way",
-                leg1 = {odd = perm[1]},
-                leg2 = {odd = perm[2]},
-                leg3 = {odd = perm[3]},
-                profit_pct = string.format("%.2f", profit_pct),
-                implied_prob = string.format("%.4f", prob_3way)
-            })
+            if profit_pct > best_profit then
+                best_profit = profit_pct
+                best = {
+                    '3-way',
+                    string.format("%.2f", profit_pct),
+                    string.format("%.4f", prob_3way),
+                    '', '', tostring(perm[1][2]),
+                    '', '', tostring(perm[2][2]),
+                    tostring(perm[3][2])
+                }
+            end
         end
     end
 end
 
--- Step 4: Return results
-if #arbs > 0 then
-    -- Encode as JSON-like string (Lua doesn't have native JSON)
-    -- Python will parse this
-    local result = {
-        event_key = string.gsub(pinnacle_key, "odds:pinnacle:", ""),
-        market_type = market_type,
-        timestamp = timestamp,
-        arbitrages = arbs,
-        count = #arbs
-    }
-
-    -- Simple serialization (Python will parse)
-    return cjson.encode(result)
-else
-    -- No arbitrage found
-    return nil
-end
+-- Step 4: Return the best arbitrage as a flat array (nil if none found)
+return best
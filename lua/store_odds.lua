@@ -0,0 +1,28 @@
+--[[
+Project Acheron - Atomic Odds Write
+Redis Lua Script that stores an odds hash and sets its TTL in one round trip
+
+Folding HSET + EXPIRE into a single EVALSHA halves the Redis RTTs on the
+hot path (this runs for every WebSocket tick).
+
+Usage from Python:
+    result = redis.eval(lua_script, 1, odds_key, home, away, draw, market_type, timestamp)
+]]--
+
+local key = KEYS[1]  -- e.g., "odds:{12345}:soft:moneyline"
+
+redis.call('HSET', key,
+    'home', ARGV[1],
+    'away', ARGV[2],
+    'draw', ARGV[3],
+    'market_type', ARGV[4],
+    'timestamp', ARGV[5],
+    'inv_home', ARGV[6],
+    'inv_away', ARGV[7],
+    'inv_draw', ARGV[8]
+)
+
+-- Set expiry (30 minutes) to auto-cleanup stale odds
+redis.call('EXPIRE', key, 1800)
+
+return 1
@@ -5,7 +5,7 @@ Run this on your computer (connected to phone hotspot) to get cookies
 """
 
 import asyncio
-import json
+import orjson
 import yaml
 from pathlib import Path
 import sys
@@ -60,8 +60,8 @@ async def authenticate_and_save():
 
     # Save to file
     output_file = Path(__file__).parent.parent / 'session_data.json'
-    with open(output_file, 'w') as f:
-        json.dump(session_data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(session_data, option=orjson.OPT_INDENT_2))
 
     print(f"💾 Session data saved to: {output_file}")
     print()
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Project Acheron - Lua Script SHA Generator
+Regenerates lua/*.sha1 files so the engine can EVALSHA on first request
+Run this whenever a Lua script changes (e.g. as a packaging step)
+"""
+
+import hashlib
+from pathlib import Path
+
+LUA_DIR = Path(__file__).parent.parent / 'lua'
+
+
+def main():
+    for script_path in sorted(LUA_DIR.glob('*.lua')):
+        sha = hashlib.sha1(script_path.read_bytes()).hexdigest()
+        sha_path = script_path.with_suffix('.sha1')
+        sha_path.write_text(sha + '\n')
+        print(f"{script_path.name}: {sha}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,88 @@ Project Acheron - Arbitrage Detection Engine
 Redis-based atomic arbitrage detection using Lua scripts
 """
 
-import json
+import time
 import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
-from datetime import datetime
 import redis.asyncio as redis
+from redis.exceptions import NoScriptError
 from loguru import logger
 
 
+# Inline fallbacks for the lua/ scripts, used when the files are missing.
+# SHAs are computed once at import so registration can go straight to
+# EVALSHA / SCRIPT LOAD without a disk read.
+INLINE_CHECK_ARB = """
+        local pinnacle_key = KEYS[1]
+        local soft_key = KEYS[2]
+        local home_odd = tonumber(ARGV[1])
+        local away_odd = tonumber(ARGV[2])
+        local draw_odd = tonumber(ARGV[3])
+        local timestamp = ARGV[4]
+        local market_type = ARGV[5]
+        local event_id = ARGV[6]
+        local inv_home = tonumber(ARGV[7]) or 0
+        local inv_away = tonumber(ARGV[8]) or 0
+        local inv_draw = tonumber(ARGV[9]) or 0
+
+        redis.call('HSET', pinnacle_key, 'home', home_odd, 'away', away_odd, 'draw', draw_odd, 'inv_home', inv_home, 'inv_away', inv_away, 'inv_draw', inv_draw, 'timestamp', timestamp, 'market_type', market_type)
+        redis.call('EXPIRE', pinnacle_key, 1800)
+
+        if event_id and event_id ~= '' then
+            redis.call('SADD', 'active_events', event_id)
+        end
+
+        local soft_exists = redis.call('EXISTS', soft_key)
+        if soft_exists == 0 then
+            return nil
+        end
+
+        local soft_away = tonumber(redis.call('HGET', soft_key, 'away'))
+        local inv_soft_away = tonumber(redis.call('HGET', soft_key, 'inv_away')) or 0
+        if inv_soft_away == 0 or inv_home == 0 then
+            return nil
+        end
+
+        local prob = inv_home + inv_soft_away
+        if prob < 1.0 then
+            local profit = ((1 / prob) - 1) * 100
+            return {
+                '2-way',
+                string.format('%.2f', profit),
+                string.format('%.4f', prob),
+                'pinnacle', 'home', tostring(home_odd),
+                'soft', 'away', tostring(soft_away)
+            }
+        end
+
+        return nil
+        """
+
+INLINE_STORE_ODDS = """
+        redis.call('HSET', KEYS[1], 'home', ARGV[1], 'away', ARGV[2], 'draw', ARGV[3], 'market_type', ARGV[4], 'timestamp', ARGV[5], 'inv_home', ARGV[6], 'inv_away', ARGV[7], 'inv_draw', ARGV[8])
+        redis.call('EXPIRE', KEYS[1], 1800)
+        return 1
+        """
+
+INLINE_CHECK_ARB_SHA = hashlib.sha1(INLINE_CHECK_ARB.encode()).hexdigest()
+INLINE_STORE_ODDS_SHA = hashlib.sha1(INLINE_STORE_ODDS.encode()).hexdigest()
+
+
+class _EngineStats:
+    """Slotted counters for the hot path (attribute add, no dict hashing)"""
+
+    __slots__ = ('odds_updates', 'arbs_detected', 'arbs_alerted', 'lua_executions', 'cache_hits')
+
+    def __init__(self):
+        self.odds_updates = 0
+        self.arbs_detected = 0
+        self.arbs_alerted = 0
+        self.lua_executions = 0
+        self.cache_hits = 0
+
+
 class ArbitrageEngine:
     """
     High-performance arbitrage detection engine using Redis + Lua
@@ -29,40 +103,63 @@ class ArbitrageEngine:
 
         # Redis connection
         self.redis: Optional[redis.Redis] = None
+        self.pool: Optional[redis.ConnectionPool] = None
+
+        # Micro-batching for soft-book writes (flushed by _soft_flush_loop)
+        self._soft_queue: Optional[asyncio.Queue] = None
+        self._soft_flush_task: Optional[asyncio.Task] = None
+
+        # Last-seen odds per key as [odds_tuple, last_seen_monotonic]:
+        # duplicate ticks skip Redis entirely and TTLs are refreshed in a
+        # periodic batch instead. LRU-capped so a long run over many
+        # events doesn't grow this forever; the refresher evicts entries
+        # whose ticks stopped, letting their keys expire naturally.
+        self._last_odds: OrderedDict = OrderedDict()
+        self._ttl_refresh_task: Optional[asyncio.Task] = None
+
+        # Monotonic time of the last successful Redis command; the health
+        # monitor reads this instead of issuing its own ping when traffic
+        # is flowing
+        self.last_success_time: float = 0.0
 
         # Load Lua scripts
         self.lua_scripts = {}
         self._load_lua_scripts()
 
         # Statistics
-        self.stats = {
-            'odds_updates': 0,
-            'arbs_detected': 0,
-            'arbs_alerted': 0,
-            'lua_executions': 0,
-            'cache_hits': 0
-        }
+        self.stats = _EngineStats()
 
         logger.info("ArbitrageEngine initialized")
 
     async def initialize(self):
         """Initialize Redis connection and load Lua scripts"""
         try:
-            # Create Redis connection
-            self.redis = await redis.from_url(
+            # Create Redis connection pool so concurrent awaits (odds writes,
+            # health pings, cleanup) don't serialize through one connection
+            self.pool = redis.ConnectionPool.from_url(
                 f"redis://{self.redis_config['host']}:{self.redis_config['port']}/{self.redis_config['db']}",
                 password=self.redis_config.get('password'),
                 encoding="utf-8",
-                decode_responses=True
+                decode_responses=True,
+                max_connections=self.redis_config.get('max_connections', 32),
+                health_check_interval=30,
+                socket_keepalive=True
             )
+            self.redis = redis.Redis(connection_pool=self.pool)
 
             # Test connection
             await self.redis.ping()
+            self.last_success_time = time.monotonic()
             logger.info("✅ Redis connection established")
 
             # Register Lua scripts
             await self._register_lua_scripts()
 
+            # Start the soft-book write batcher and the TTL refresher
+            self._soft_queue = asyncio.Queue()
+            self._soft_flush_task = asyncio.create_task(self._soft_flush_loop())
+            self._ttl_refresh_task = asyncio.create_task(self._ttl_refresh_loop())
+
         except Exception as e:
             logger.error(f"Failed to initialize Redis: {e}")
             raise
@@ -73,25 +170,72 @@ class ArbitrageEngine:
             with open('lua/check_arb.lua', 'r') as f:
                 self.lua_scripts['check_arb'] = f.read()
 
+            with open('lua/store_odds.lua', 'r') as f:
+                self.lua_scripts['store_odds'] = f.read()
+
             logger.info("Lua scripts loaded from disk")
 
         except FileNotFoundError as e:
             logger.error(f"Lua script file not found: {e}")
-            # Fallback: inline Lua script
-            self.lua_scripts['check_arb'] = self._get_inline_check_arb_script()
+            # Fallback: inline Lua constants (SHAs precomputed at import)
+            self.lua_scripts['check_arb'] = INLINE_CHECK_ARB
+            self.lua_scripts['store_odds'] = INLINE_STORE_ODDS
+            self._check_arb_sha = INLINE_CHECK_ARB_SHA
             logger.warning("Using inline Lua script fallback")
+            return
+
+        # Prefer the SHA shipped alongside the script (scripts/gen_lua_sha.py)
+        # so the first request after a restart is one EVALSHA, not EVAL
+        self._check_arb_sha = self._load_script_sha(
+            'lua/check_arb.sha1', self.lua_scripts['check_arb']
+        )
+
+    @staticmethod
+    def _load_script_sha(sha_path: str, script: str) -> str:
+        """Read a precomputed script SHA1, falling back to computing it"""
+        computed = hashlib.sha1(script.encode('utf-8')).hexdigest()
+
+        try:
+            with open(sha_path, 'r') as f:
+                shipped = f.read().strip()
+
+            if shipped == computed:
+                return shipped
+
+            logger.warning(f"Stale SHA in {sha_path}, using computed value "
+                           "(re-run scripts/gen_lua_sha.py)")
+        except FileNotFoundError:
+            pass
+
+        return computed
 
     async def _register_lua_scripts(self):
         """Register Lua scripts with Redis for faster execution"""
         try:
             if 'check_arb' in self.lua_scripts:
-                script = self.redis.register_script(self.lua_scripts['check_arb'])
-                self.lua_scripts['check_arb_fn'] = script
-                logger.info("✅ Lua scripts registered with Redis")
+                # Only SCRIPT LOAD if Redis doesn't already have the SHA
+                exists = await self.redis.script_exists(self._check_arb_sha)
+                if not exists[0]:
+                    loaded_sha = await self.redis.script_load(self.lua_scripts['check_arb'])
+                    if loaded_sha != self._check_arb_sha:
+                        logger.warning(f"check_arb SHA mismatch, using server value {loaded_sha}")
+                        self._check_arb_sha = loaded_sha
+
+            if 'store_odds' in self.lua_scripts:
+                script = self.redis.register_script(self.lua_scripts['store_odds'])
+                self.lua_scripts['store_odds_fn'] = script
+
+            logger.info("✅ Lua scripts registered with Redis")
 
         except Exception as e:
             logger.error(f"Failed to register Lua scripts: {e}")
 
+    # Dedupe-cache tuning: hard cap on tracked keys (LRU eviction
+    # beyond this) and how long a silent key stays in the refresh set —
+    # matches the 1800s TTL the Lua scripts put on odds hashes
+    _MAX_DEDUPE_ENTRIES = 4096
+    _ODDS_TTL = 1800
+
     async def process_odds_update(
         self,
         event_id: str,
@@ -113,46 +257,79 @@ class ArbitrageEngine:
         Returns:
             Arbitrage data if found, None otherwise
         """
+        book_key = None
+
         try:
             # Build Redis keys
-            pinnacle_key = f"odds:pinnacle:{event_id}:{market_type}"
-            soft_key = f"odds:soft:{event_id}:{market_type}"  # Placeholder for other books
-
-            timestamp = datetime.now().timestamp()
-
-            # Store odds in Redis
-            if book.lower() == 'pinnacle':
-                key = pinnacle_key
-            else:
-                key = soft_key
-
-            await self._store_odds(key, odds, market_type, timestamp)
-            self.stats['odds_updates'] += 1
+            # {event_id} in braces is a Redis Cluster hash tag: both books'
+            # keys for an event land on the same slot, so the Lua scripts
+            # stay valid under cluster mode
+            pinnacle_key = f"odds:{{{event_id}}}:pinnacle:{market_type}"
+            soft_key = f"odds:{{{event_id}}}:soft:{market_type}"  # Placeholder for other books
+
+            # Dedupe: Pinnacle resends unchanged odds constantly; identical
+            # ticks skip Redis entirely (the TTL refresher keeps keys alive)
+            book_key = pinnacle_key if book.lower() == 'pinnacle' else soft_key
+            odds_tuple = (odds.get('home', 0), odds.get('away', 0), odds.get('draw', 0))
+
+            entry = self._last_odds.get(book_key)
+            if entry is not None and entry[0] == odds_tuple:
+                # Still ticking — bump last-seen so the TTL refresher
+                # keeps the key alive, and refresh LRU recency
+                entry[1] = time.monotonic()
+                self._last_odds.move_to_end(book_key)
+                self.stats.cache_hits += 1
+                return None
 
-            # Check for arbitrage (only if this is Pinnacle update)
+            # Committed optimistically so concurrent identical ticks dedupe;
+            # every failed-write path below pops it again, otherwise one
+            # transient Redis error would suppress retries (and the TTL
+            # refresher would keep the stale key alive) until the odds move
+            self._last_odds[book_key] = [odds_tuple, time.monotonic()]
+            self._last_odds.move_to_end(book_key)
+            while len(self._last_odds) > self._MAX_DEDUPE_ENTRIES:
+                self._last_odds.popitem(last=False)
+
+            timestamp = time.time()
+            self.stats.odds_updates += 1
+
+            # Pinnacle updates: the check_arb script already writes the odds,
+            # sets the TTL and runs the arb check in one atomic EVALSHA, so no
+            # separate store call is needed. Soft book updates: single merged
+            # store_odds EVALSHA.
             if book.lower() == 'pinnacle':
                 arb_result = await self._check_arbitrage_lua(
                     pinnacle_key=pinnacle_key,
                     soft_key=soft_key,
                     odds=odds,
                     market_type=market_type,
-                    timestamp=timestamp
+                    timestamp=timestamp,
+                    event_id=event_id
                 )
 
                 if arb_result:
-                    self.stats['arbs_detected'] += 1
+                    self.stats.arbs_detected += 1
 
                     # Send notification
                     if self.notifier and event_info:
                         await self.notifier.send_arbitrage_alert(arb_result, event_info)
-                        self.stats['arbs_alerted'] += 1
+                        self.stats.arbs_alerted += 1
 
                     return arb_result
+            else:
+                # Soft updates only need to land before the next Pinnacle
+                # tick, so queue them for the pipelined batch flush
+                if self._soft_queue is not None:
+                    self._soft_queue.put_nowait((soft_key, odds, market_type, timestamp))
+                else:
+                    await self._store_odds(soft_key, odds, market_type, timestamp)
 
             return None
 
         except Exception as e:
             logger.error(f"Error processing odds update: {e}")
+            # Uncommit the dedupe entry so the next identical tick retries
+            self._last_odds.pop(book_key, None)
             return None
 
     async def _store_odds(
@@ -160,19 +337,133 @@ class ArbitrageEngine:
         key: str,
         odds: Dict[str, float],
         market_type: str,
-        timestamp: float
+        timestamp: float,
+        client=None
     ):
-        """Store odds in Redis hash"""
-        data = {
-            'home': odds.get('home', 0),
-            'away': odds.get('away', 0),
-            'draw': odds.get('draw', 0),
-            'market_type': market_type,
-            'timestamp': timestamp
-        }
+        """Store odds in Redis hash (single EVALSHA: HSET + EXPIRE in one RTT)"""
+        inv_home, inv_away, inv_draw = self._compute_reciprocals(odds)
+
+        await self.lua_scripts['store_odds_fn'](
+            keys=[key],
+            args=[
+                odds.get('home', 0),
+                odds.get('away', 0),
+                odds.get('draw', 0),
+                market_type,
+                timestamp,
+                inv_home,
+                inv_away,
+                inv_draw
+            ],
+            client=client
+        )
+
+    async def _soft_flush_loop(self, max_batch: int = 100, max_wait: float = 0.01):
+        """
+        Drain queued soft-book writes in pipelined batches
+
+        Flushes whenever 100 items are pending or 10ms have passed since the
+        first queued item, so a burst of soft updates costs one round trip
+        instead of one per update.
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                items = [await self._soft_queue.get()]
+                deadline = loop.time() + max_wait
+
+                while len(items) < max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        items.append(await asyncio.wait_for(self._soft_queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                try:
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        for key, odds, market_type, timestamp in items:
+                            await self._store_odds(key, odds, market_type, timestamp, client=pipe)
+                        await pipe.execute()
+                    self.last_success_time = time.monotonic()
+                except Exception as e:
+                    logger.error(f"Error flushing soft odds batch: {e}")
+                    # Uncommit the batch's dedupe entries; a newer tick may
+                    # be dropped with them, which just costs one redundant
+                    # write later — the safe direction
+                    for key, _, _, _ in items:
+                        self._last_odds.pop(key, None)
+
+        except asyncio.CancelledError:
+            logger.debug("Soft odds flush loop cancelled")
+
+    async def _ttl_refresh_loop(self, interval: float = 60.0):
+        """
+        Periodically re-EXPIRE every deduped key in one pipeline
+
+        Duplicate ticks never reach Redis, so their keys would otherwise
+        expire while the market sits still. Keys whose ticks have stopped
+        entirely (finished events) are dropped from the refresh set so
+        they expire naturally, and keys that are already gone are evicted
+        from the dedupe cache — both bound its size.
+        """
+        try:
+            while True:
+                await asyncio.sleep(interval)
+
+                if not self._last_odds:
+                    continue
+
+                now = time.monotonic()
+                keys = []
+                for key, entry in list(self._last_odds.items()):
+                    if now - entry[1] > self._ODDS_TTL:
+                        # No tick within the key TTL — stop keeping the
+                        # Redis key alive and forget the entry
+                        self._last_odds.pop(key, None)
+                    else:
+                        keys.append(key)
+
+                if not keys:
+                    continue
+
+                try:
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        for key in keys:
+                            pipe.expire(key, self._ODDS_TTL)
+                        results = await pipe.execute()
+                    self.last_success_time = time.monotonic()
+
+                    # EXPIRE returns 0 for missing keys — drop those entries
+                    for key, refreshed in zip(keys, results):
+                        if not refreshed:
+                            self._last_odds.pop(key, None)
+
+                except Exception as e:
+                    logger.error(f"Error refreshing odds TTLs: {e}")
+
+        except asyncio.CancelledError:
+            logger.debug("TTL refresh loop cancelled")
+
+    @staticmethod
+    def _compute_reciprocals(odds: Dict[str, float]) -> tuple:
+        """
+        Pre-compute 1/odd for each outcome at ingest
 
-        await self.redis.hset(key, mapping=data)
-        await self.redis.expire(key, 1800)  # 30 minute expiry
+        Storing reciprocals lets the Lua arb check sum implied probabilities
+        with additions only, keeping divisions out of single-threaded Redis.
+        """
+        home = odds.get('home', 0)
+        away = odds.get('away', 0)
+        draw = odds.get('draw', 0)
+
+        return (
+            1.0 / home if home else 0,
+            1.0 / away if away else 0,
+            1.0 / draw if draw else 0
+        )
 
     async def _check_arbitrage_lua(
         self,
@@ -180,7 +471,8 @@ class ArbitrageEngine:
         soft_key: str,
         odds: Dict[str, float],
         market_type: str,
-        timestamp: float
+        timestamp: float,
+        event_id: str = ''
     ) -> Optional[Dict[str, Any]]:
         """
         Execute Lua script for atomic arbitrage detection
@@ -189,102 +481,91 @@ class ArbitrageEngine:
             Arbitrage data if found, None otherwise
         """
         try:
-            # Execute Lua script
-            result = await self.lua_scripts['check_arb_fn'](
-                keys=[pinnacle_key, soft_key],
-                args=[
-                    odds.get('home', 0),
-                    odds.get('away', 0),
-                    odds.get('draw', 0),
-                    timestamp,
-                    market_type
-                ]
-            )
+            inv_home, inv_away, inv_draw = self._compute_reciprocals(odds)
+
+            args = [
+                odds.get('home', 0),
+                odds.get('away', 0),
+                odds.get('draw', 0),
+                timestamp,
+                market_type,
+                event_id,
+                inv_home,
+                inv_away,
+                inv_draw
+            ]
+
+            # Execute via the precomputed SHA; re-LOAD only on NOSCRIPT
+            # (e.g. after a Redis restart or SCRIPT FLUSH)
+            try:
+                result = await self.redis.evalsha(
+                    self._check_arb_sha, 2, pinnacle_key, soft_key, *args
+                )
+            except NoScriptError:
+                self._check_arb_sha = await self.redis.script_load(self.lua_scripts['check_arb'])
+                result = await self.redis.evalsha(
+                    self._check_arb_sha, 2, pinnacle_key, soft_key, *args
+                )
 
-            self.stats['lua_executions'] += 1
+            self.stats.lua_executions += 1
+            self.last_success_time = time.monotonic()
 
             if result:
-                # Parse JSON result from Lua
-                arb_data = json.loads(result)
+                # Lua returns a flat array — build the arb dict directly,
+                # no JSON encode/decode on either side
+                arb_data = self._parse_arb_result(result)
                 logger.info(f"🎯 Arbitrage detected: {arb_data}")
                 return arb_data
             else:
                 return None
 
         except Exception as e:
+            # No Python fallback: re-running the check over HGETALL is racy
+            # and doubles latency exactly when Redis is already distressed.
+            # NOSCRIPT is retried above; anything else just drops the tick —
+            # minus its dedupe entry, so the next tick retries the write.
             logger.error(f"Error executing Lua arbitrage check: {e}")
-            # Fallback to Python-based check
-            return await self._check_arbitrage_python(pinnacle_key, soft_key, odds)
+            self._last_odds.pop(pinnacle_key, None)
+            return None
 
-    async def _check_arbitrage_python(
-        self,
-        pinnacle_key: str,
-        soft_key: str,
-        pinnacle_odds: Dict[str, float]
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Fallback Python-based arbitrage detection
-        (Less efficient than Lua due to network round trips)
+    @staticmethod
+    def _parse_arb_result(result: List[str]) -> Dict[str, Any]:
         """
-        try:
-            # Fetch soft book odds
-            soft_data = await self.redis.hgetall(soft_key)
-
-            if not soft_data:
-                return None
-
-            soft_odds = {
-                'home': float(soft_data.get('home', 0)),
-                'away': float(soft_data.get('away', 0)),
-                'draw': float(soft_data.get('draw', 0))
-            }
+        Build an arbitrage dict from the flat array returned by check_arb.lua
 
-            # Check timestamp staleness
-            soft_timestamp = float(soft_data.get('timestamp', 0))
-            current_timestamp = datetime.now().timestamp()
-
-            if (current_timestamp - soft_timestamp) > 60:
-                # Soft book odds too old
-                return None
-
-            # Calculate arbitrage: Pinnacle home vs Soft away
-            home_odd = pinnacle_odds.get('home', 0)
-            soft_away = soft_odds.get('away', 0)
-
-            if home_odd > 0 and soft_away > 0:
-                prob = (1 / home_odd) + (1 / soft_away)
-
-                if prob < 1.0:
-                    profit_pct = ((1 / prob) - 1) * 100
+        Array layout: [type, profit_pct, implied_prob,
+                       leg1_book, leg1_market, leg1_odd,
+                       leg2_book, leg2_market, leg2_odd, (leg3_odd)]
+        """
+        arb_data = {
+            'type': result[0],
+            'profit_pct': result[1],
+            'implied_prob': result[2],
+            'leg1': {'book': result[3], 'market': result[4], 'odd': float(result[5])},
+            'leg2': {'book': result[6], 'market': result[7], 'odd': float(result[8])}
+        }
 
-                    return {
-                        'type': '2-way',
-                        'profit_pct': f"{profit_pct:.2f}",
-                        'leg1': {'book': 'pinnacle', 'market': 'home', 'odd': home_odd},
-                        'leg2': {'book': 'soft', 'market': 'away', 'odd': soft_away},
-                        'implied_prob': f"{prob:.4f}"
-                    }
+        if result[0] == '3-way' and len(result) > 9:
+            arb_data['leg3'] = {'odd': float(result[9])}
 
-            return None
-
-        except Exception as e:
-            logger.error(f"Error in Python arbitrage check: {e}")
-            return None
+        return arb_data
 
     async def get_current_odds(self, event_id: str, market_type: str) -> Optional[Dict[str, Any]]:
         """Get current odds for an event/market"""
         try:
-            pinnacle_key = f"odds:pinnacle:{event_id}:{market_type}"
-            data = await self.redis.hgetall(pinnacle_key)
+            pinnacle_key = f"odds:{{{event_id}}}:pinnacle:{market_type}"
+            home, away, draw, timestamp = await self.redis.hmget(
+                pinnacle_key, 'home', 'away', 'draw', 'timestamp'
+            )
 
-            if not data:
+            if home is None and away is None:
                 return None
 
             return {
-                'home': float(data.get('home', 0)),
-                'away': float(data.get('away', 0)),
-                'draw': float(data.get('draw', 0)),
-                'timestamp': float(data.get('timestamp', 0))
+                'home': float(home or 0),
+                'away': float(away or 0),
+                'draw': float(draw or 0),
+                'timestamp': float(timestamp or 0)
             }
 
         except Exception as e:
@@ -292,38 +573,60 @@ class ArbitrageEngine:
             return None
 
     async def get_active_events(self) -> List[str]:
-        """Get list of currently tracked event IDs"""
+        """Get list of currently tracked event IDs (O(1) read of the set index)"""
         try:
-            # Scan for all odds keys
-            keys = []
-            async for key in self.redis.scan_iter(match="odds:pinnacle:*"):
-                # Extract event ID from key format: odds:pinnacle:{event_id}:{market}
-                parts = key.split(':')
-                if len(parts) >= 3:
-                    event_id = parts[2]
-                    if event_id not in keys:
-                        keys.append(event_id)
-
-            return keys
+            # The check_arb script SADDs each Pinnacle event_id into this set;
+            # cleanup_stale_odds reconciles it against the live keyspace.
+            return list(await self.redis.smembers('active_events'))
 
         except Exception as e:
             logger.error(f"Error fetching active events: {e}")
             return []
 
     async def cleanup_stale_odds(self, max_age_seconds: int = 3600):
-        """Remove odds older than specified age"""
+        """Remove odds older than specified age (pipelined, ~2 RTTs per 500 keys)"""
         try:
             cleaned = 0
-            current_time = datetime.now().timestamp()
-
-            async for key in self.redis.scan_iter(match="odds:*"):
-                timestamp = await self.redis.hget(key, 'timestamp')
-
-                if timestamp:
-                    age = current_time - float(timestamp)
-                    if age > max_age_seconds:
-                        await self.redis.delete(key)
-                        cleaned += 1
+            current_time = time.time()
+            batch: List[str] = []
+            live_event_ids = set()
+
+            async def _sweep_batch(keys: List[str]) -> int:
+                # One pipeline flush to read all timestamps, one to delete
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for k in keys:
+                        pipe.hget(k, 'timestamp')
+                    timestamps = await pipe.execute()
+
+                to_delete = []
+                for k, ts in zip(keys, timestamps):
+                    if ts and (current_time - float(ts)) > max_age_seconds:
+                        to_delete.append(k)
+                    elif ':pinnacle:' in k:
+                        # Key format: odds:{event_id}:pinnacle:{market} —
+                        # slice the event_id out of the hash tag braces
+                        live_event_ids.add(k[6:k.index('}')])
+
+                if to_delete:
+                    await self.redis.delete(*to_delete)
+
+                return len(to_delete)
+
+            async for key in self.redis.scan_iter(match="odds:*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    cleaned += await _sweep_batch(batch)
+                    batch = []
+
+            if batch:
+                cleaned += await _sweep_batch(batch)
+
+            # Reconcile the active_events index against the live keyspace
+            # (covers members whose keys expired via TTL rather than sweep)
+            indexed = await self.redis.smembers('active_events')
+            stale_events = set(indexed) - live_event_ids
+            if stale_events:
+                await self.redis.srem('active_events', *stale_events)
 
             if cleaned > 0:
                 logger.info(f"🧹 Cleaned up {cleaned} stale odds entries")
@@ -333,48 +636,32 @@ class ArbitrageEngine:
 
     def get_stats(self) -> Dict[str, int]:
         """Get engine statistics"""
-        return self.stats.copy()
+        return {k: getattr(self.stats, k) for k in _EngineStats.__slots__}
 
     async def close(self):
         """Close Redis connection"""
+        # Cancel the background loops and let them unwind before tearing
+        # down the pool — a flush caught mid-execute would otherwise race
+        # the disconnect and die with connection errors
+        loops = [t for t in (self._soft_flush_task, self._ttl_refresh_task) if t]
+        self._soft_flush_task = None
+        self._ttl_refresh_task = None
+
+        for task in loops:
+            task.cancel()
+        for task in loops:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
         if self.redis:
             await self.redis.close()
+        if self.pool:
+            await self.pool.disconnect()
+        if self.redis or self.pool:
             logger.info("Redis connection closed")
 
-    @staticmethod
-    def _get_inline_check_arb_script() -> str:
-        """Inline Lua script fallback (simplified version)"""
-        return """
-        local pinnacle_key = KEYS[1]
-        local soft_key = KEYS[2]
-        local home_odd = tonumber(ARGV[1])
-        local away_odd = tonumber(ARGV[2])
-        local draw_odd = tonumber(ARGV[3])
-        local timestamp = ARGV[4]
-        local market_type = ARGV[5]
-
-        redis.call('HSET', pinnacle_key, 'home', home_odd, 'away', away_odd, 'draw', draw_odd, 'timestamp', timestamp)
-        redis.call('EXPIRE', pinnacle_key, 1800)
-
-        local soft_exists = redis.call('EXISTS', soft_key)
-        if soft_exists == 0 then
-            return nil
-        end
-
-        local soft_away = tonumber(redis.call('HGET', soft_key, 'away'))
-        if not soft_away or soft_away == 0 then
-            return nil
-        end
-
-        local prob = (1 / home_odd) + (1 / soft_away)
-        if prob < 1.0 then
-            local profit = ((1 / prob) - 1) * 100
-            return string.format('{"profit_pct": "%.2f", "type": "2-way"}', profit)
-        end
-
-        return nil
-        """
-
 
 # Example usage
 if __name__ == "__main__":
@@ -4,11 +4,27 @@ Self-healing system that monitors component health and triggers recovery actions
 """
 
 import asyncio
+import time
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime, timedelta
 from loguru import logger
 
 
+class _CompHealth:
+    """Slotted per-component health record (attribute access, no dict hashing)"""
+
+    __slots__ = ('status', 'last_check', 'last_healthy', 'consecutive_failures')
+
+    def __init__(self):
+        self.status = 'unknown'
+        self.last_check = None
+        self.last_healthy = None
+        self.consecutive_failures = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
 class HealthMonitor:
     """
     Monitors system health and triggers recovery actions
@@ -34,7 +50,7 @@ class HealthMonitor:
         self.components: Dict[str, Any] = {}
 
         # Health status
-        self.component_health: Dict[str, Dict[str, Any]] = {}
+        self.component_health: Dict[str, _CompHealth] = {}
 
         # Recovery callbacks
         self.recovery_callbacks: Dict[str, Callable] = {}
@@ -69,12 +85,7 @@ class HealthMonitor:
             recovery_callback: Async function to call for recovery
         """
         self.components[name] = component
-        self.component_health[name] = {
-            'status': 'unknown',
-            'last_check': None,
-            'last_healthy': None,
-            'consecutive_failures': 0
-        }
+        self.component_health[name] = _CompHealth()
 
         if recovery_callback:
             self.recovery_callbacks[name] = recovery_callback
@@ -90,7 +101,7 @@ class HealthMonitor:
             try:
                 await self._perform_health_checks()
                 self.system_stats['total_health_checks'] += 1
-                self.last_check_time = datetime.now().timestamp()
+                self.last_check_time = time.time()
 
                 await asyncio.sleep(self.check_interval)
 
@@ -102,21 +113,25 @@ class HealthMonitor:
         """Perform health checks on all registered components"""
         logger.debug("Performing health checks...")
 
-        for name, component in self.components.items():
-            try:
-                is_healthy = await self._check_component_health(name, component)
-
-                if is_healthy:
-                    await self._mark_component_healthy(name)
-                else:
-                    await self._mark_component_unhealthy(name)
-
-            except Exception as e:
-                logger.error(f"Error checking health of {name}: {e}")
+        # Run all component checks concurrently so total wall time is the
+        # slowest check (e.g. a Redis ping) rather than the sum of them
+        names = list(self.components.keys())
+        results = await asyncio.gather(
+            *(self._check_component_health(name, self.components[name]) for name in names),
+            return_exceptions=True
+        )
+
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error checking health of {name}: {result}")
+                await self._mark_component_unhealthy(name)
+            elif result:
+                await self._mark_component_healthy(name)
+            else:
                 await self._mark_component_unhealthy(name)
 
         # Log summary
-        healthy_count = sum(1 for h in self.component_health.values() if h['status'] == 'healthy')
+        healthy_count = sum(1 for h in self.component_health.values() if h.status == 'healthy')
         total_count = len(self.component_health)
 
         logger.debug(f"Health check complete: {healthy_count}/{total_count} components healthy")
@@ -189,7 +204,11 @@ class HealthMonitor:
                 last_msg_time = interceptor.last_message_time
 
                 if last_msg_time:
-                    time_since_msg = datetime.now().timestamp() - last_msg_time
+                    # Interceptor stamps messages with its event-loop clock;
+                    # compare in the same clock domain
+                    loop = getattr(interceptor, '_loop', None)
+                    now = loop.time() if loop else time.monotonic()
+                    time_since_msg = now - last_msg_time
 
                     if time_since_msg > self.websocket_timeout:
                         logger.warning(f"No WebSocket messages for {time_since_msg:.0f}s (timeout: {self.websocket_timeout}s)")
@@ -208,9 +227,17 @@ class HealthMonitor:
             if not hasattr(engine, 'redis') or not engine.redis:
                 return False
 
-            # Try a simple Redis ping
+            # A Redis command succeeded recently — connection is live, no
+            # need to spend a round trip (the pool also pings in-band via
+            # health_check_interval)
+            last_ok = getattr(engine, 'last_success_time', 0)
+            if last_ok and (time.monotonic() - last_ok) < 60:
+                return True
+
+            # No recent traffic: fall back to one explicit ping
             try:
                 await engine.redis.ping()
+                engine.last_success_time = time.monotonic()
                 return True
             except:
                 logger.warning("Redis connection lost")
@@ -236,12 +263,12 @@ class HealthMonitor:
     async def _mark_component_healthy(self, name: str):
         """Mark component as healthy"""
         health = self.component_health[name]
-        previous_status = health['status']
+        previous_status = health.status
 
-        health['status'] = 'healthy'
-        health['last_check'] = datetime.now().timestamp()
-        health['last_healthy'] = datetime.now().timestamp()
-        health['consecutive_failures'] = 0
+        health.status = 'healthy'
+        health.last_check = time.time()
+        health.last_healthy = time.time()
+        health.consecutive_failures = 0
 
         # If component recovered, log it
         if previous_status == 'unhealthy':
@@ -257,16 +284,16 @@ class HealthMonitor:
     async def _mark_component_unhealthy(self, name: str):
         """Mark component as unhealthy and trigger recovery"""
         health = self.component_health[name]
-        previous_status = health['status']
+        previous_status = health.status
 
-        health['status'] = 'unhealthy'
-        health['last_check'] = datetime.now().timestamp()
-        health['consecutive_failures'] += 1
+        health.status = 'unhealthy'
+        health.last_check = time.time()
+        health.consecutive_failures += 1
 
         self.system_stats['component_failures'] += 1
 
         # Log failure
-        failures = health['consecutive_failures']
+        failures = health.consecutive_failures
         logger.warning(f"⚠️  {name} is unhealthy (consecutive failures: {failures})")
 
         # Trigger recovery if callback exists
@@ -304,11 +331,12 @@ class HealthMonitor:
 
     def get_component_status(self, name: str) -> Dict[str, Any]:
         """Get health status for a specific component"""
-        return self.component_health.get(name, {'status': 'unknown'}).copy()
+        health = self.component_health.get(name)
+        return health.as_dict() if health else {'status': 'unknown'}
 
     def get_all_status(self) -> Dict[str, Dict[str, Any]]:
         """Get health status for all components"""
-        return self.component_health.copy()
+        return {name: h.as_dict() for name, h in self.component_health.items()}
 
     def get_system_stats(self) -> Dict[str, Any]:
         """Get system-wide statistics"""
@@ -322,8 +350,8 @@ class HealthMonitor:
         # Add component summary
         stats['components'] = {
             'total': len(self.component_health),
-            'healthy': sum(1 for h in self.component_health.values() if h['status'] == 'healthy'),
-            'unhealthy': sum(1 for h in self.component_health.values() if h['status'] == 'unhealthy')
+            'healthy': sum(1 for h in self.component_health.values() if h.status == 'healthy'),
+            'unhealthy': sum(1 for h in self.component_health.values() if h.status == 'unhealthy')
         }
 
         return stats
@@ -341,8 +369,8 @@ class HealthMonitor:
 
         # Log individual component status
         for name, health in self.component_health.items():
-            status_emoji = "✅" if health['status'] == 'healthy' else "❌"
-            logger.info(f"  {status_emoji} {name}: {health['status']}")
+            status_emoji = "✅" if health.status == 'healthy' else "❌"
+            logger.info(f"  {status_emoji} {name}: {health.status}")
 
     async def stop(self):
         """Stop health monitoring"""
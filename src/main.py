@@ -4,13 +4,29 @@ Coordinates all components for autonomous operation
 """
 
 import asyncio
+import os
+import random
 import signal
 import sys
+import time
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Optional
+import httpx
 import yaml
 from loguru import logger
 
+# libyaml's C loader parses ~5-10x faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Which component the current coroutine is acting on — attached to log
+# records structurally (via the loguru patcher) instead of baking
+# "Recovering X:" prefixes into every message string
+_COMPONENT: ContextVar[str] = ContextVar('component', default='-')
+
 # Import our modules
 from proxy_manager import ProxyManager
 from scout import Scout
@@ -32,10 +48,25 @@ class Acheron:
     - HealthMonitor (self-healing)
     """
 
+    __slots__ = (
+        'config', 'proxy_manager', 'notifier', 'engine', 'scout',
+        'interceptor', 'health_monitor', 'shutdown_event',
+        '_session_cache', '_session_cache_exp', '_notify_q', '_notify_task',
+        '_recovery_backoff', '_leagues_str', '_markets_str', '_topic',
+        '_http',
+    )
+
     def __init__(self, config_path: str = "config.yaml"):
         # Load configuration
         self.config = self._load_config(config_path)
 
+        # Resolve frequently used config values once — _load_config is the
+        # single point of truth, and hot/alert paths shouldn't walk nested
+        # dicts or rebuild joined strings
+        self._leagues_str = ' '.join(self.config['sports']['leagues'])
+        self._markets_str = ' '.join(self.config['sports']['markets'])
+        self._topic = self.config['notifications']['ntfy']['topic']
+
         # Configure logging
         self._configure_logging()
 
@@ -48,16 +79,60 @@ class Acheron:
         self.health_monitor: Optional[HealthMonitor] = None
 
         # Application state
-        self.is_running = False
         self.shutdown_event = asyncio.Event()
 
+        # Short-TTL cache for scout session data (get_session_data copies
+        # the dict on every call; the session only changes on refresh)
+        self._session_cache: Optional[dict] = None
+        self._session_cache_exp: float = 0.0
+
+        # System alerts are queued and sent by a drain task so callers
+        # (including the shutdown path) never block on an ntfy POST
+        self._notify_q: asyncio.Queue = asyncio.Queue(maxsize=256)
+        self._notify_task: Optional[asyncio.Task] = None
+
+        # Per-component recovery backoff (doubles on failure, capped at
+        # 60s, reset on success) — fixed delays either stampede the
+        # dependency or slow recovery down when it's already healthy
+        self._recovery_backoff = dict(self._BACKOFF_BASE)
+
+        # Shared HTTP client handed to components (created in initialize)
+        self._http: Optional[httpx.AsyncClient] = None
+
         logger.info("🚀 Project Acheron initialized")
 
+    @classmethod
+    async def create(cls, config_path: str = "config.yaml") -> "Acheron":
+        """
+        Build an Acheron without blocking the event loop
+
+        __init__ reads and parses config.yaml and opens the log sinks —
+        all disk I/O. Constructing in a worker thread keeps the loop
+        responsive to signals from second 0 (asyncio.Event/Queue bind
+        their loop lazily, so off-loop construction is safe on 3.10+).
+        """
+        return await asyncio.to_thread(cls, config_path)
+
+    # Parsed-config cache keyed by (path, mtime) so recovery paths that
+    # reload the config don't reparse an unchanged file
+    _config_cache: dict = {}
+
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from YAML file"""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            cache_key = (config_path, Path(config_path).stat().st_mtime)
+            cached = self._config_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Bytes input + C loader: fastest path through libyaml
+            with open(config_path, 'rb') as f:
+                config = yaml.load(f, Loader=_YamlLoader)
+
+            self._validate_config(config, config_path)
+
+            self._config_cache.clear()
+            self._config_cache[cache_key] = config
 
             logger.info(f"✅ Configuration loaded from {config_path}")
             return config
@@ -69,6 +144,41 @@ class Acheron:
             logger.error(f"Error parsing configuration: {e}")
             sys.exit(1)
 
+    # Dotted paths every component dereferences unconditionally — missing
+    # keys should fail here, once, instead of deep inside a coroutine
+    # after Chromium has already launched
+    _REQUIRED_CONFIG_PATHS = (
+        'pinnacle.username',
+        'pinnacle.password',
+        'proxy',
+        'redis.host',
+        'redis.port',
+        'redis.db',
+        'notifications.ntfy.server',
+        'notifications.ntfy.topic',
+        'notifications.thresholds',
+        'sports.leagues',
+        'sports.markets',
+        'stealth.browser',
+        'stealth.timing',
+        'monitoring.logging',
+    )
+
+    def _validate_config(self, config: dict, config_path: str):
+        """Fail fast with one clear error if required keys are missing"""
+        missing = []
+        for path in self._REQUIRED_CONFIG_PATHS:
+            node = config
+            for part in path.split('.'):
+                if not isinstance(node, dict) or part not in node:
+                    missing.append(path)
+                    break
+                node = node[part]
+
+        if missing:
+            logger.error(f"Configuration {config_path} is missing required keys: {', '.join(missing)}")
+            sys.exit(1)
+
     def _configure_logging(self):
         """Configure loguru logger"""
         log_config = self.config['monitoring']['logging']
@@ -76,25 +186,48 @@ class Acheron:
         # Remove default logger
         logger.remove()
 
-        # Add console logger
+        # Tag every record with the active component contextvar
+        logger.configure(
+            patcher=lambda record: record['extra'].update(component=_COMPONENT.get())
+        )
+
+        # Add console logger. enqueue=True moves formatting/IO to a
+        # background thread so logger calls on the hot path never stall
+        # the event loop; backtrace/diagnose off skips frame introspection
         logger.add(
             sys.stderr,
             level=log_config.get('level', 'INFO'),
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> | <level>{message}</level>"
+            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> | <magenta>{extra[component]}</magenta> | <level>{message}</level>",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
         )
 
-        # Add file logger
+        # Add file logger (plain format — no ANSI markup parsing per record)
         log_file = log_config.get('file', 'logs/acheron.log')
         Path(log_file).parent.mkdir(parents=True, exist_ok=True)
 
         logger.add(
             log_file,
             level=log_config.get('level', 'INFO'),
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function} | {extra[component]} | {message}",
             rotation=f"{log_config.get('max_size_mb', 100)} MB",
             retention=f"{log_config.get('backup_count', 5)} files",
-            compression="zip"
+            compression="zip",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
         )
 
+        # Optional: flag coroutines that hog the event loop (a blocking
+        # call here silently stalls WebSocket reads)
+        try:
+            from aiodebug import log_slow_callbacks
+            log_slow_callbacks.enable(0.05)
+            logger.info("aiodebug slow-callback logging enabled (50ms)")
+        except ImportError:
+            pass
+
         logger.info("Logging configured")
 
     async def initialize(self):
@@ -102,37 +235,55 @@ class Acheron:
         try:
             logger.info("Initializing components...")
 
-            # 1. Proxy Manager
-            self.proxy_manager = ProxyManager(self.config)
-            await self.proxy_manager.initialize()
+            # 1. Shared HTTP client: ntfy POSTs and proxy API calls reuse
+            # one pooled connection set instead of a TLS handshake each
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=50, keepalive_expiry=300.0)
+            )
+
+            # Construct components (cheap, no I/O)
+            self.proxy_manager = ProxyManager(self.config, http_client=self._http)
+            self.notifier = Notifier(self.config, http_client=self._http)
+            self._notify_task = asyncio.create_task(self._drain_notifications())
+            self.engine = ArbitrageEngine(self.config, notifier=self.notifier)
+
+            # 2. Stage 1: proxy fetch and Redis pool have no mutual
+            # dependency — overlap their I/O
+            await asyncio.gather(
+                self.proxy_manager.initialize(),
+                self.engine.initialize()
+            )
 
-            # 2. Notifier
-            self.notifier = Notifier(self.config)
+            # Publish our PID so the MCP server can see a scraper it
+            # didn't launch itself (docker-compose, manual run)
+            try:
+                await self.engine.redis.set('acheron:pid', os.getpid())
+            except Exception as e:
+                logger.warning(f"Could not publish PID to Redis: {e}")
 
-            # Send test notification
+            # 3. Stage 2: Scout needs the proxy manager; the test
+            # notification is independent and overlaps the Chromium launch
+            self.scout = Scout(self.config, proxy_manager=self.proxy_manager)
             logger.info("Sending test notification...")
-            test_sent = await self.notifier.send_test_notification()
+            _, test_sent = await asyncio.gather(
+                self.scout.initialize(),
+                self.notifier.send_test_notification()
+            )
             if test_sent:
                 logger.info("✅ Test notification sent successfully")
             else:
                 logger.warning("⚠️  Test notification failed (check ntfy.sh topic)")
 
-            # 3. Arbitrage Engine
-            self.engine = ArbitrageEngine(self.config, notifier=self.notifier)
-            await self.engine.initialize()
-
-            # 4. Scout
-            self.scout = Scout(self.config, proxy_manager=self.proxy_manager)
-            await self.scout.initialize()
-
-            # 5. Interceptor
+            # 4. Interceptor
             self.interceptor = Interceptor(
                 self.config,
                 proxy_manager=self.proxy_manager,
                 engine=self.engine
             )
 
-            # 6. Health Monitor
+            # 5. Health Monitor
             self.health_monitor = HealthMonitor(self.config, notifier=self.notifier)
 
             # Register components for monitoring
@@ -163,11 +314,80 @@ class Acheron:
             logger.error(f"Failed to initialize components: {e}")
             raise
 
+    def _queue_alert(self, title: str, message: str, priority: int = 3):
+        """Queue a system alert for the drain task (never blocks)"""
+        try:
+            self._notify_q.put_nowait({'title': title, 'message': message, 'priority': priority})
+        except asyncio.QueueFull:
+            logger.warning(f"Notification queue full, dropping alert: {title}")
+
+    async def _drain_notifications(self):
+        """
+        Send queued system alerts without blocking callers
+
+        Alerts of the same priority arriving within 200ms of each other
+        (e.g. an auth failure immediately followed by shutdown) are
+        coalesced into one multi-line POST instead of separate round trips.
+        """
+        try:
+            while True:
+                msg = await self._notify_q.get()
+                merged = 1
+
+                # Opportunistically merge same-priority follow-ups
+                while True:
+                    try:
+                        nxt = await asyncio.wait_for(self._notify_q.get(), timeout=0.2)
+                    except asyncio.TimeoutError:
+                        break
+
+                    if nxt['priority'] == msg['priority']:
+                        msg['message'] += f"\n---\n{nxt['title']}: {nxt['message']}"
+                        merged += 1
+                    else:
+                        # Different priority: send what we have, carry on
+                        await self._send_alert(msg, merged)
+                        msg, merged = nxt, 1
+
+                await self._send_alert(msg, merged)
+
+        except asyncio.CancelledError:
+            logger.debug("Notification drain task cancelled")
+
+    async def _send_alert(self, msg: dict, merged: int):
+        """Send one (possibly coalesced) alert and mark queue items done"""
+        try:
+            await self.notifier.send_system_alert(**msg)
+        except Exception as e:
+            logger.error(f"Failed to send system alert: {e}")
+        finally:
+            for _ in range(merged):
+                self._notify_q.task_done()
+
+    def _cached_session(self) -> dict:
+        """Return scout session data, cached for up to 60s"""
+        now = time.monotonic()
+        if self._session_cache is not None and now < self._session_cache_exp:
+            return self._session_cache
+
+        self._session_cache = self.scout.get_session_data()
+        ttl = self.scout.time_until_expiry()
+        self._session_cache_exp = now + min(ttl if ttl is not None else 60, 60)
+        return self._session_cache
+
+    def _invalidate_session_cache(self):
+        """Drop the cached session (call after any re-authentication)"""
+        self._session_cache = None
+        self._session_cache_exp = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Derived from the shutdown event — a separate bool can drift"""
+        return not self.shutdown_event.is_set()
+
     async def start(self):
         """Start the application"""
         try:
-            self.is_running = True
-
             logger.info("=" * 60)
             logger.info("🎯 PROJECT ACHERON STARTING")
             logger.info("=" * 60)
@@ -178,7 +398,7 @@ class Acheron:
 
             if not auth_success:
                 logger.error("❌ Authentication failed. Cannot proceed.")
-                await self.notifier.send_system_alert(
+                self._queue_alert(
                     title="🚨 Acheron Startup Failed",
                     message="Failed to authenticate to Pinnacle. Check credentials and proxy settings.",
                     priority=5
@@ -189,110 +409,262 @@ class Acheron:
 
             # Step 2: Set session data for Interceptor
             logger.info("Step 2/4: Configuring WebSocket connection...")
-            session_data = self.scout.get_session_data()
+            session_data = self._cached_session()
             self.interceptor.set_session_data(session_data)
 
             logger.info(f"WebSocket URL: {session_data.get('websocket_url')}")
             logger.info(f"Session expires in: {self.scout.time_until_expiry():.0f}s")
 
-            # Step 3: Start Health Monitor
+            # Steps 3+4: background tasks (health monitor, WebSocket feed,
+            # periodic scheduler, lag watchdog)
             logger.info("Step 3/4: Starting health monitoring...")
-            monitor_task = asyncio.create_task(self.health_monitor.start_monitoring())
-
-            # Step 4: Start Interceptor (WebSocket listener)
             logger.info("Step 4/4: Starting real-time odds feed...")
-            interceptor_task = asyncio.create_task(self.interceptor.listen())
 
-            # Start session refresh task
-            refresh_task = asyncio.create_task(self._session_refresh_loop())
+            background = (
+                ('monitor', self.health_monitor.start_monitoring),
+                ('interceptor', self.interceptor.listen),
+                ('scheduler', self._periodic_scheduler),
+                ('lag-monitor', self._loop_lag_monitor),
+            )
 
-            # Start periodic status logging
-            status_task = asyncio.create_task(self._status_logging_loop())
+            if hasattr(asyncio, 'TaskGroup'):
+                await self._run_supervised(background)
+            else:
+                await self._run_gathered(background)
 
-            logger.info("=" * 60)
-            logger.info("✅ PROJECT ACHERON IS RUNNING")
-            logger.info("=" * 60)
-            logger.info(f"Monitoring: {self.config['sports']['leagues']} | {self.config['sports']['markets']}")
-            logger.info(f"Alerts: ntfy.sh/{self.config['notifications']['ntfy']['topic']}")
-            logger.info("Press Ctrl+C to stop")
-            logger.info("=" * 60)
+        except Exception as e:
+            logger.error(f"Error in main loop: {e}")
+            raise
 
-            # Send startup notification
-            await self.notifier.send_system_alert(
-                title="🚀 Acheron Started",
-                message=f"Project Acheron is now running and monitoring {' '.join(self.config['sports']['leagues'])} odds in real-time.",
-                priority=3
+    def _log_running_banner(self):
+        """Log the startup banner and queue the startup notification"""
+        logger.info("=" * 60)
+        logger.info("✅ PROJECT ACHERON IS RUNNING")
+        logger.info("=" * 60)
+        logger.info(f"Monitoring: {self._leagues_str} | {self._markets_str}")
+        logger.info(f"Alerts: ntfy.sh/{self._topic}")
+        logger.info("Press Ctrl+C to stop")
+        logger.info("=" * 60)
+
+        self._queue_alert(
+            title="🚀 Acheron Started",
+            message=f"Project Acheron is now running and monitoring {self._leagues_str} odds in real-time.",
+            priority=3
+        )
+
+    async def _run_supervised(self, background):
+        """
+        Run background tasks in a TaskGroup (Python 3.11+)
+
+        Structured concurrency: a crashing task cancels its siblings and
+        the exception reaches us directly instead of being swallowed by
+        return_exceptions=True; no orphan tasks survive this block. The
+        group runs in its own task because TaskGroup exit waits
+        unboundedly for cancelled children — the wait on that task is
+        what lets the teardown be bounded like _run_gathered's.
+        """
+        tasks = []
+
+        async def _group_runner():
+            async with asyncio.TaskGroup() as tg:
+                for name, fn in background:
+                    tasks.append(tg.create_task(fn(), name=name))
+
+                self._log_running_banner()
+
+                # Wait for shutdown signal, then cancel the group's tasks;
+                # the TaskGroup exit waits for the cancellations to land
+                await self.shutdown_event.wait()
+                logger.info("Shutting down...")
+                for task in tasks:
+                    task.cancel()
+
+        runner = asyncio.create_task(_group_runner(), name='supervisor')
+        shutdown_wait = asyncio.create_task(
+            self.shutdown_event.wait(), name='shutdown-wait'
+        )
+
+        try:
+            # Runner finishing first means a task crashed; the shutdown
+            # event first means a normal stop, where the drain gets the
+            # same 5s bound as _run_gathered — a task stuck in a blocking
+            # call must not hold up the whole shutdown (orchestrators
+            # SIGKILL after ~10s)
+            await asyncio.wait(
+                {runner, shutdown_wait}, return_when=asyncio.FIRST_COMPLETED
             )
 
-            # Wait for shutdown signal
-            await self.shutdown_event.wait()
+            if not runner.done():
+                _, pending = await asyncio.wait({runner}, timeout=5.0)
+                if pending:
+                    stragglers = [t.get_name() for t in tasks if not t.done()]
+                    logger.warning(f"Straggling tasks at shutdown: {stragglers}")
+                    return  # abandon them; process exit is the backstop
 
-            # Cleanup tasks
-            logger.info("Shutting down...")
-            monitor_task.cancel()
-            interceptor_task.cancel()
-            refresh_task.cancel()
-            status_task.cancel()
+            runner.result()  # propagate a crashed task's exception
+        finally:
+            shutdown_wait.cancel()
 
-            await asyncio.gather(
-                monitor_task,
-                interceptor_task,
-                refresh_task,
-                status_task,
-                return_exceptions=True
-            )
+    async def _run_gathered(self, background):
+        """Fallback supervision via cancel + bounded gather (pre-3.11)"""
+        tasks = [asyncio.create_task(fn(), name=name) for name, fn in background]
 
-        except Exception as e:
-            logger.error(f"Error in main loop: {e}")
-            raise
+        self._log_running_banner()
+
+        # Wait for shutdown signal
+        await self.shutdown_event.wait()
 
-    async def _session_refresh_loop(self):
-        """Periodically check and refresh authentication session"""
+        # Cleanup tasks
+        logger.info("Shutting down...")
+        for task in tasks:
+            task.cancel()
+
+        # Bound the wait: a task stuck in a blocking call must not hold
+        # up the whole shutdown (orchestrators SIGKILL after ~10s)
         try:
-            while self.is_running:
-                # Check every 5 minutes
-                await asyncio.sleep(300)
+            await asyncio.wait_for(
+                asyncio.gather(*tasks, return_exceptions=True),
+                timeout=5.0
+            )
+        except asyncio.TimeoutError:
+            stragglers = [t.get_name() for t in tasks if not t.done()]
+            logger.warning(f"Straggling tasks at shutdown: {stragglers}")
+
+    def _next_refresh_delay(self) -> float:
+        """Seconds until the session should be refreshed (~2min early)"""
+        ttl = self.scout.time_until_expiry() if self.scout else None
+        return max(30.0, ttl - 120.0) if ttl is not None else 300.0
+
+    async def _refresh_session_job(self) -> float:
+        """
+        Refresh the authentication session just before it expires
+
+        Deadline-driven: scheduled ~2 minutes before expiry instead of
+        polling every 5 minutes, so there are no wasted wakeups and the
+        session can never lapse between polls.
+        """
+        if self.scout:
+            logger.info("Session nearing expiry, refreshing...")
+            refreshed = await self.scout.refresh_session_if_needed()
 
-                if self.scout:
-                    logger.info("Checking session status...")
-                    refreshed = await self.scout.refresh_session_if_needed()
+            if refreshed and self.scout.is_session_valid():
+                logger.info("Session refreshed, updating Interceptor...")
+                self._invalidate_session_cache()
+                session_data = self._cached_session()
+                self.interceptor.set_session_data(session_data)
 
-                    if refreshed and not self.scout.is_session_valid():
-                        # Session was refreshed
-                        logger.info("Session refreshed, updating Interceptor...")
-                        session_data = self.scout.get_session_data()
-                        self.interceptor.set_session_data(session_data)
+        return self._next_refresh_delay()
 
-        except asyncio.CancelledError:
-            logger.debug("Session refresh loop cancelled")
+    async def _log_status_job(self) -> float:
+        """Log system status (every 30 minutes)"""
+        if self.health_monitor:
+            await self.health_monitor.log_system_status()
+
+        # Log component stats lazily — get_stats only runs if a sink
+        # actually accepts INFO records
+        if self.engine:
+            logger.opt(lazy=True).info("Engine: {}", self.engine.get_stats)
+
+        if self.interceptor:
+            logger.opt(lazy=True).info("Interceptor: {}", self.interceptor.get_stats)
+
+        return 1800.0
+
+    async def _cleanup_odds_job(self) -> float:
+        """Sweep stale odds keys and prune active_events (every 30 minutes)"""
+        if self.engine:
+            await self.engine.cleanup_stale_odds()
+        return 1800.0
+
+    async def _periodic_scheduler(self):
+        """
+        Single task driving all periodic jobs
+
+        One deadline list and one wait replace a task + sleep + cancel
+        edge per job; each job returns the delay until its next run, so
+        deadline-driven work (session refresh) and fixed-interval work
+        (status logging) share the same loop. Waking on the shutdown
+        event makes exit instant.
+        """
+        mono = time.monotonic
+        jobs = [
+            [mono() + self._next_refresh_delay(), self._refresh_session_job],
+            [mono() + 1800.0, self._log_status_job],
+            [mono() + 1800.0, self._cleanup_odds_job],
+        ]
 
-    async def _status_logging_loop(self):
-        """Periodically log system status"""
         try:
             while self.is_running:
-                # Log every 30 minutes
-                await asyncio.sleep(1800)
+                jobs.sort(key=lambda job: job[0])
+                entry = jobs[0]
+
+                try:
+                    await asyncio.wait_for(
+                        self.shutdown_event.wait(),
+                        timeout=max(0.0, entry[0] - mono())
+                    )
+                    return  # shutdown requested
+                except asyncio.TimeoutError:
+                    pass
+
+                try:
+                    delay = await entry[1]()
+                except Exception as e:
+                    logger.error(f"Error in periodic job {entry[1].__name__}: {e}")
+                    delay = 60.0  # retry failed jobs shortly
+
+                entry[0] = mono() + delay
 
-                if self.health_monitor:
-                    await self.health_monitor.log_system_status()
+        except asyncio.CancelledError:
+            logger.debug("Periodic scheduler cancelled")
 
-                # Log component stats
-                if self.engine:
-                    engine_stats = self.engine.get_stats()
-                    logger.info(f"Engine: {engine_stats}")
+    async def _loop_lag_monitor(self, interval: float = 5.0):
+        """
+        Watchdog for event-loop lag
 
-                if self.interceptor:
-                    interceptor_stats = self.interceptor.get_stats()
-                    logger.info(f"Interceptor: {interceptor_stats}")
+        Sleeps a fixed interval and measures how late the wakeup was —
+        sustained lag means some coroutine is blocking the loop and
+        starving the WebSocket feed.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+
+            while self.is_running:
+                before = loop.time()
+                await asyncio.sleep(interval)
+                lag = loop.time() - before - interval
+
+                if lag > 0.1:
+                    logger.warning(
+                        f"⚠️  Event loop lag: {lag * 1000:.0f}ms "
+                        f"({len(asyncio.all_tasks())} tasks) — something is blocking the loop"
+                    )
 
         except asyncio.CancelledError:
-            logger.debug("Status logging loop cancelled")
+            logger.debug("Loop lag monitor cancelled")
+
+    _BACKOFF_BASE = {'scout': 0.5, 'interceptor': 1.0, 'engine': 0.5}
+
+    async def _backoff_sleep(self, name: str):
+        """Sleep the component's current backoff delay plus jitter"""
+        delay = min(60.0, self._recovery_backoff[name])
+        await asyncio.sleep(delay + random.uniform(0, delay))
+
+    def _backoff_result(self, name: str, success: bool):
+        """Reset backoff on success, double it (capped) on failure"""
+        if success:
+            self._recovery_backoff[name] = self._BACKOFF_BASE[name]
+        else:
+            self._recovery_backoff[name] = min(60.0, self._recovery_backoff[name] * 2)
 
     async def _recover_scout(self):
         """Recovery action for Scout (re-authenticate)"""
-        logger.info("Recovering Scout: re-authenticating...")
+        _COMPONENT.set('scout')
+        logger.info("Recovering: re-authenticating...")
 
         try:
+            await self._backoff_sleep('scout')
+
             # Close existing browser
             await self.scout.close()
 
@@ -304,25 +676,30 @@ class Acheron:
 
             if success:
                 # Update Interceptor with new session
-                session_data = self.scout.get_session_data()
+                self._invalidate_session_cache()
+                session_data = self._cached_session()
                 self.interceptor.set_session_data(session_data)
                 logger.info("✅ Scout recovered successfully")
             else:
                 logger.error("❌ Scout recovery failed")
 
+            self._backoff_result('scout', success)
+
         except Exception as e:
             logger.error(f"Error during Scout recovery: {e}")
+            self._backoff_result('scout', False)
 
     async def _recover_interceptor(self):
         """Recovery action for Interceptor (reconnect)"""
-        logger.info("Recovering Interceptor: reconnecting...")
+        _COMPONENT.set('interceptor')
+        logger.info("Recovering: reconnecting...")
 
         try:
             # Close existing connection
             await self.interceptor.close()
 
-            # Wait a bit
-            await asyncio.sleep(5)
+            # Back off (with jitter) before reconnecting
+            await self._backoff_sleep('interceptor')
 
             # Try to reconnect
             success = await self.interceptor.connect()
@@ -332,33 +709,38 @@ class Acheron:
             else:
                 logger.error("❌ Interceptor recovery failed")
 
+            self._backoff_result('interceptor', success)
+
         except Exception as e:
             logger.error(f"Error during Interceptor recovery: {e}")
+            self._backoff_result('interceptor', False)
 
     async def _recover_engine(self):
         """Recovery action for Engine (reconnect Redis)"""
-        logger.info("Recovering Engine: reconnecting to Redis...")
+        _COMPONENT.set('engine')
+        logger.info("Recovering: reconnecting to Redis...")
 
         try:
             # Close existing connection
             await self.engine.close()
 
-            # Wait a bit
-            await asyncio.sleep(2)
+            # Back off (with jitter) before reconnecting
+            await self._backoff_sleep('engine')
 
             # Reinitialize
             await self.engine.initialize()
 
             logger.info("✅ Engine recovered successfully")
+            self._backoff_result('engine', True)
 
         except Exception as e:
             logger.error(f"Error during Engine recovery: {e}")
+            self._backoff_result('engine', False)
 
     async def shutdown(self):
         """Graceful shutdown"""
         logger.info("Initiating graceful shutdown...")
 
-        self.is_running = False
         self.shutdown_event.set()
 
         # Close all components
@@ -369,42 +751,62 @@ class Acheron:
             await self.scout.close()
 
         if self.engine:
+            # Retract the published PID before the connection goes away —
+            # a stale entry could false-match a reused PID later
+            if self.engine.redis:
+                try:
+                    await self.engine.redis.delete('acheron:pid')
+                except Exception:
+                    pass
             await self.engine.close()
 
-        if self.notifier:
-            await self.notifier.close()
-
         if self.health_monitor:
             await self.health_monitor.stop()
 
-        logger.info("✅ Shutdown complete")
-
-        # Send shutdown notification
+        # Queue the shutdown notification, flush the queue (bounded), then
+        # close the notifier
         if self.notifier:
-            await self.notifier.send_system_alert(
+            self._queue_alert(
                 title="🛑 Acheron Stopped",
                 message="Project Acheron has shut down.",
                 priority=3
             )
 
+            try:
+                await asyncio.wait_for(self._notify_q.join(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out flushing notification queue")
+
+            if self._notify_task:
+                self._notify_task.cancel()
+
+            await self.notifier.close()
+
+        # Shared client closes last — components borrowed it
+        if self._http:
+            await self._http.aclose()
 
-def signal_handler(acheron_instance):
-    """Handle shutdown signals"""
-    def handler(signum, frame):
-        logger.info(f"Received signal {signum}, shutting down...")
-        asyncio.create_task(acheron_instance.shutdown())
+        logger.info("✅ Shutdown complete")
 
-    return handler
+        # Flush records queued by the enqueue=True sinks before exiting
+        logger.complete()
 
 
 async def main():
     """Main entry point"""
-    # Create Acheron instance
-    acheron = Acheron()
+    # Create Acheron instance (config/log-sink I/O runs off-loop)
+    acheron = await Acheron.create()
 
-    # Setup signal handlers
-    signal.signal(signal.SIGINT, signal_handler(acheron))
-    signal.signal(signal.SIGTERM, signal_handler(acheron))
+    # Setup signal handlers via the event loop's self-pipe — safe to call
+    # from signal context, unlike create_task from signal.signal handlers
+    loop = asyncio.get_running_loop()
+    try:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, acheron.shutdown_event.set)
+    except NotImplementedError:
+        # add_signal_handler is unsupported on Windows event loops
+        signal.signal(signal.SIGINT, lambda signum, frame: acheron.shutdown_event.set())
+        signal.signal(signal.SIGTERM, lambda signum, frame: acheron.shutdown_event.set())
 
     try:
         # Initialize
@@ -424,5 +826,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop drops in libuv's C event loop — cuts asyncio scheduling
+    # overhead 2-4x for the socket-heavy WebSocket/Redis/proxy workload
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # default loop (e.g. on Windows)
+
     # Run the application
     asyncio.run(main())
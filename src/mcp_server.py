@@ -4,65 +4,210 @@ Provides remote management tools via Model Context Protocol
 """
 
 import asyncio
-import json
+import copy
 import os
-import subprocess
+import select
+import signal
 import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 
 import redis.asyncio as redis
 import yaml
 from fastmcp import FastMCP
 from loguru import logger
 
+# orjson when available — C parser, several times faster on alert blobs
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# libyaml C bindings when available — 5-10x faster parse/dump
+try:
+    _YamlLoader = yaml.CSafeLoader
+    _YamlDumper = yaml.CSafeDumper
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+    _YamlDumper = yaml.SafeDumper
+
 # Initialize FastMCP server
 mcp = FastMCP("Acheron Manager")
 
+# Paths built once at import — tools shouldn't reallocate them per call
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_LOG_PATH = _BASE_DIR / "logs" / "acheron.log"
+
 # Global state
-_config: Optional[Dict] = None
+_CONFIG_PATH = _BASE_DIR / "config.yaml"
+# path -> (mtime, size, parsed dict, dumped YAML string)
+_yaml_cache: Dict[str, Tuple[float, int, Dict, str]] = {}
 _redis_client: Optional[redis.Redis] = None
-_scraper_process: Optional[subprocess.Popen] = None
+_redis_pool: Optional[redis.ConnectionPool] = None
+_scraper_process: Optional[asyncio.subprocess.Process] = None
+_cpu_primed = False  # psutil.cpu_percent has a baseline sample
+
+
+def _load_yaml_cached(path: Path) -> Tuple[float, int, Dict, str]:
+    """
+    Parse config once per (mtime, size) — repeated tool calls skip the
+    disk read and YAML parse entirely while the file is unchanged
+    """
+    st = os.stat(path)
+    key = str(path)
+    entry = _yaml_cache.get(key)
+
+    if entry is None or entry[0] != st.st_mtime or entry[1] != st.st_size:
+        with open(path, 'r') as f:
+            parsed = yaml.load(f, Loader=_YamlLoader)
+        dumped = yaml.dump(parsed, Dumper=_YamlDumper, default_flow_style=False)
+        entry = (st.st_mtime, st.st_size, parsed, dumped)
+        _yaml_cache[key] = entry
+
+    return entry
 
 
 async def get_config() -> Dict:
-    """Load configuration from YAML"""
-    global _config
-    if _config is None:
-        config_path = Path(__file__).parent.parent / "config.yaml"
-        with open(config_path, 'r') as f:
-            _config = yaml.safe_load(f)
-    return _config
+    """Load configuration from YAML (cached until the file changes)"""
+    # Deep copy so a caller mutating its view can't poison the cache
+    return copy.deepcopy(_load_yaml_cached(_CONFIG_PATH)[2])
+
+
+_today_cache: Tuple[float, str] = (0.0, '')
+
+
+def _today() -> str:
+    """Today's date string, memoized for 60s (strftime isn't free)"""
+    global _today_cache
+    now = time.time()
+    ts, val = _today_cache
+    if now - ts >= 60.0:
+        val = datetime.now().strftime('%Y-%m-%d')
+        _today_cache = (now, val)
+    return val
 
 
 async def get_redis() -> redis.Redis:
-    """Get Redis client connection"""
-    global _redis_client
+    """Get Redis client backed by a shared connection pool"""
+    global _redis_client, _redis_pool
     if _redis_client is None:
         config = await get_config()
         redis_config = config['redis']
-        _redis_client = redis.Redis(
+        # A pool lets concurrent tool calls use separate connections
+        # instead of serializing head-of-line on one socket
+        _redis_pool = redis.ConnectionPool(
             host=os.getenv('REDIS_HOST', redis_config['host']),
             port=int(os.getenv('REDIS_PORT', redis_config['port'])),
             db=redis_config['db'],
             password=redis_config.get('password'),
-            decode_responses=True
+            decode_responses=True,
+            max_connections=16,
+            health_check_interval=30,
+            socket_keepalive=True
         )
+        _redis_client = redis.Redis(connection_pool=_redis_pool)
     return _redis_client
 
 
-def is_scraper_running() -> bool:
-    """Check if scraper process is running"""
+async def close_redis():
+    """Release pooled Redis connections (called on server shutdown)"""
+    global _redis_client, _redis_pool
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+    if _redis_pool is not None:
+        await _redis_pool.disconnect()
+        _redis_pool = None
+
+
+async def _run_git(*args: str) -> Tuple[int, str, str]:
+    """Run a git command without blocking the event loop"""
+    proc = await asyncio.create_subprocess_exec(
+        'git', *args,
+        cwd=str(_BASE_DIR),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    out, err = await proc.communicate()
+    return proc.returncode, out.decode().strip(), err.decode().strip()
+
+
+async def _get_tracked_pid() -> int:
+    """PID of the running scraper (0 if unknown)"""
+    if _scraper_process is not None and _scraper_process.returncode is None:
+        return _scraper_process.pid
+
+    try:
+        r = await get_redis()
+        pid = int(await r.get('acheron:pid') or 0)
+    except Exception:
+        pid = 0
+
+    if pid:
+        return pid
+
+    # No published PID — fall back to a cmdline scan so a scraper
+    # started outside both this server and main.py is still visible
+    return await _pgrep_scraper()
+
+
+async def _pgrep_scraper() -> int:
+    """Find a scraper process by cmdline (0 if none)"""
     try:
-        result = subprocess.run(
-            ['pgrep', '-f', 'src/main.py'],
-            capture_output=True,
-            text=True
+        proc = await asyncio.create_subprocess_exec(
+            'pgrep', '-f', 'src/main.py',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
         )
-        return result.returncode == 0
+        stdout, _ = await proc.communicate()
+        pids = stdout.split()
+        return int(pids[0]) if pids else 0
     except Exception:
-        return False
+        return 0
+
+
+async def _clear_tracked_pid():
+    """Drop the published PID so a reused PID can't false-match later"""
+    try:
+        r = await get_redis()
+        await r.delete('acheron:pid')
+    except Exception:
+        pass
+
+
+# Last probe result with its monotonic timestamp — tools like
+# scraper_restart probe several times within milliseconds
+_last_probe: Tuple[float, bool] = (0.0, False)
+
+
+async def is_scraper_running(fresh: bool = False) -> bool:
+    """
+    Check if scraper process is running
+
+    Probes the tracked PID with a zero signal — a single syscall,
+    versus the fork+exec and /proc scan a pgrep subprocess costs.
+    Results are memoized for 500ms; pass fresh=True right after a
+    start/stop where staleness matters.
+    """
+    global _last_probe
+    now = time.monotonic()
+    ts, cached = _last_probe
+    if not fresh and now - ts < 0.5:
+        return cached
+
+    running = False
+    pid = await _get_tracked_pid()
+    if pid:
+        try:
+            os.kill(pid, 0)
+            running = True
+        except (ProcessLookupError, PermissionError, ValueError):
+            pass
+
+    _last_probe = (now, running)
+    return running
 
 
 @mcp.tool()
@@ -82,7 +227,7 @@ async def scraper_status() -> Dict[str, Any]:
     """
     try:
         status = {
-            "running": is_scraper_running(),
+            "running": await is_scraper_running(),
             "uptime_hours": 0.0,
             "odds_updates": 0,
             "alerts_today": 0,
@@ -94,12 +239,17 @@ async def scraper_status() -> Dict[str, Any]:
         # Try to get stats from Redis
         try:
             r = await get_redis()
-            await r.ping()
-            status["redis_connected"] = True
+            today = _today()
 
-            # Get scraper stats from Redis
-            stats_key = "acheron:stats"
-            stats = await r.hgetall(stats_key)
+            # Bundle the reads into one pipeline — a single round-trip
+            # instead of one RTT per command. No explicit ping: the
+            # pipeline succeeding is itself proof of connectivity.
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.hgetall("acheron:stats")
+                pipe.get(f"acheron:alerts:count:{today}")
+                stats, count = await pipe.execute()
+
+            status["redis_connected"] = True
 
             if stats:
                 status["odds_updates"] = int(stats.get('total_odds_updates', 0))
@@ -113,11 +263,19 @@ async def scraper_status() -> Dict[str, Any]:
                     uptime = datetime.now() - start_dt
                     status["uptime_hours"] = uptime.total_seconds() / 3600
 
-            # Count today's alerts
-            alerts_key = "acheron:alerts:*"
-            today = datetime.now().strftime('%Y-%m-%d')
-            alert_keys = await r.keys(f"acheron:alerts:{today}:*")
-            status["alerts_today"] = len(alert_keys)
+            # Today's alerts come from the O(1) daily counter (the alert
+            # writer INCRs acheron:alerts:count:{date} alongside each
+            # alert). KEYS scans the entire keyspace and blocks Redis'
+            # single thread — never on a status poll.
+            if count is not None:
+                status["alerts_today"] = int(count)
+            else:
+                # Counter not populated yet — fall back to a bounded
+                # cursor SCAN, which Redis serves incrementally
+                n = 0
+                async for _ in r.scan_iter(match=f"acheron:alerts:{today}:*", count=500):
+                    n += 1
+                status["alerts_today"] = n
 
         except Exception as e:
             logger.warning(f"Could not fetch Redis stats: {e}")
@@ -140,25 +298,42 @@ async def scraper_start() -> str:
         Success/failure message
     """
     try:
-        if is_scraper_running():
+        if await is_scraper_running():
             return "❌ Scraper is already running"
 
-        # Start the scraper as a background process
-        log_file = Path(__file__).parent.parent / "logs" / "acheron.log"
+        # Start the scraper as a background process — async exec so the
+        # fork doesn't stall other tool calls, and an O_APPEND fd
+        # instead of a leaked sync file object for its stdout
+        log_file = _LOG_PATH
         log_file.parent.mkdir(exist_ok=True)
 
-        process = subprocess.Popen(
-            [sys.executable, "src/main.py"],
-            cwd=Path(__file__).parent.parent,
-            stdout=open(log_file, 'a'),
-            stderr=subprocess.STDOUT,
-            start_new_session=True
+        global _scraper_process
+        fd = os.open(
+            log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644
         )
+        try:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "src/main.py",
+                cwd=str(_BASE_DIR),
+                stdout=fd,
+                stderr=asyncio.subprocess.STDOUT,
+                start_new_session=True
+            )
+        finally:
+            os.close(fd)
+        _scraper_process = process
+
+        # Record the PID so later status checks are a single syscall
+        try:
+            r = await get_redis()
+            await r.set('acheron:pid', process.pid)
+        except Exception as e:
+            logger.warning(f"Could not record scraper PID in Redis: {e}")
 
         # Wait a bit to check if it started successfully
         await asyncio.sleep(3)
 
-        if is_scraper_running():
+        if await is_scraper_running(fresh=True):
             return "✅ Acheron scraper started successfully\n📊 Monitoring NHL odds on Pinnacle\n🔔 Notifications enabled"
         else:
             return "❌ Failed to start scraper. Check logs for details."
@@ -176,20 +351,43 @@ async def scraper_stop() -> str:
         Success/failure message
     """
     try:
-        if not is_scraper_running():
+        pid = await _get_tracked_pid()
+        if not pid or not await is_scraper_running():
             return "⚠️  Scraper is not running"
 
-        # Send SIGTERM for graceful shutdown
-        subprocess.run(['pkill', '-TERM', '-f', 'src/main.py'])
-
-        # Wait for shutdown
-        await asyncio.sleep(5)
+        # Send SIGTERM straight to the tracked PID for graceful shutdown
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return "⚠️  Scraper is not running"
 
-        if not is_scraper_running():
+        # Wait for exit event-driven via pidfd instead of a blind sleep
+        exited = False
+        try:
+            fd = os.pidfd_open(pid)
+            try:
+                loop = asyncio.get_running_loop()
+                ready, _, _ = await loop.run_in_executor(
+                    None, select.select, [fd], [], [], 10
+                )
+                exited = bool(ready)
+            finally:
+                os.close(fd)
+        except (AttributeError, OSError):
+            # pidfd_open needs Linux 5.3+ — fall back to short polls
+            for _ in range(20):
+                await asyncio.sleep(0.5)
+                if not await is_scraper_running(fresh=True):
+                    exited = True
+                    break
+
+        if exited or not await is_scraper_running(fresh=True):
+            await _clear_tracked_pid()
             return "✅ Acheron scraper stopped successfully"
         else:
             # Force kill if still running
-            subprocess.run(['pkill', '-KILL', '-f', 'src/main.py'])
+            os.kill(pid, signal.SIGKILL)
+            await _clear_tracked_pid()
             return "⚠️  Scraper force-stopped (was unresponsive to graceful shutdown)"
 
     except Exception as e:
@@ -226,7 +424,7 @@ async def view_alerts(date: str = "today", limit: int = 10) -> List[Dict[str, An
         r = await get_redis()
 
         if date == "today":
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = _today()
 
         # Get alerts from Redis sorted set
         alerts_key = f"acheron:alerts:{date}"
@@ -235,10 +433,11 @@ async def view_alerts(date: str = "today", limit: int = 10) -> List[Dict[str, An
         alerts = []
         for alert_json, timestamp in alert_data:
             try:
-                alert = json.loads(alert_json)
+                alert = _json.loads(alert_json)
                 alert['timestamp'] = datetime.fromtimestamp(timestamp).isoformat()
                 alerts.append(alert)
-            except json.JSONDecodeError:
+            except ValueError:
+                # covers JSONDecodeError for both stdlib json and orjson
                 continue
 
         if not alerts:
@@ -263,11 +462,10 @@ async def update_config(setting: str, value: Any) -> str:
         Success/failure message
     """
     try:
-        config_path = Path(__file__).parent.parent / "config.yaml"
+        config_path = _CONFIG_PATH
 
-        # Load current config
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Load current config (deep copy — safe to mutate)
+        config = await get_config()
 
         # Navigate to nested setting
         keys = setting.split('.')
@@ -281,13 +479,17 @@ async def update_config(setting: str, value: Any) -> str:
         old_value = current.get(keys[-1])
         current[keys[-1]] = value
 
-        # Save config
-        with open(config_path, 'w') as f:
-            yaml.safe_dump(config, f, default_flow_style=False)
+        # Save config atomically — write a sibling temp file and rename
+        # over the original, so a crash mid-write can't truncate it
+        dumped = yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False)
+        tmp_path = config_path.with_suffix('.yaml.tmp')
+        with tmp_path.open('w') as f:
+            f.write(dumped)
+        os.replace(tmp_path, config_path)
 
-        # Invalidate cached config
-        global _config
-        _config = None
+        # Refresh the cache in place — the next read skips the reparse
+        st = os.stat(config_path)
+        _yaml_cache[str(config_path)] = (st.st_mtime, st.st_size, config, dumped)
 
         return f"✅ Updated {setting}: {old_value} → {value}\n⚠️  Restart scraper for changes to take effect"
 
@@ -295,6 +497,52 @@ async def update_config(setting: str, value: Any) -> str:
         return f"❌ Error updating config: {str(e)}"
 
 
+# Byte needles anchored on the "| LEVEL    |" column of the file sink's
+# format, so a message that merely mentions "ERROR" doesn't false-match
+_LEVEL_NEEDLES = {
+    'debug': b'| DEBUG ',
+    'info': b'| INFO ',
+    'warning': b'| WARNING ',
+    'error': b'| ERROR ',
+    'critical': b'| CRITICAL',
+}
+
+# Filtered levels match a minority of lines, so read a wider window to
+# still fill `lines` results — capped so the worst case stays bounded
+_FILTER_WINDOW_FACTOR = 16
+_MAX_TAIL_BYTES = 4 * 1024 * 1024
+
+
+def _tail_log_file(log_file: Path, lines: int, level: str) -> str:
+    """
+    Read the last N log lines in-process (blocking — run via to_thread)
+
+    Seeks to ~512 bytes per wanted line from the end and reads one
+    bounded block, so the cost stays flat as the log file grows
+    """
+    needle = None
+    window = lines * 512
+    if level != "all":
+        needle = _LEVEL_NEEDLES.get(level.lower(), level.upper().encode())
+        window = min(window * _FILTER_WINDOW_FACTOR, _MAX_TAIL_BYTES)
+
+    size = log_file.stat().st_size
+
+    with log_file.open('rb') as f:
+        f.seek(max(0, size - window))
+        data = f.read()
+
+    entries = data.splitlines()
+    if size > window and entries:
+        entries = entries[1:]  # the seek likely landed mid-line
+
+    if needle is not None:
+        # Filter on bytes before decoding — discarded lines never decode
+        entries = [ln for ln in entries if needle in ln]
+
+    return b'\n'.join(entries[-lines:]).decode('utf-8', errors='replace')
+
+
 @mcp.tool()
 async def view_logs(lines: int = 50, level: str = "all") -> str:
     """
@@ -308,27 +556,14 @@ async def view_logs(lines: int = 50, level: str = "all") -> str:
         Recent log entries as formatted string
     """
     try:
-        log_file = Path(__file__).parent.parent / "logs" / "acheron.log"
+        log_file = _LOG_PATH
 
         if not log_file.exists():
             return "⚠️  No log file found. Scraper may not have been started yet."
 
-        # Read last N lines
-        result = subprocess.run(
-            ['tail', '-n', str(lines), str(log_file)],
-            capture_output=True,
-            text=True
-        )
-
-        logs = result.stdout
-
-        # Filter by level if requested
-        if level != "all":
-            filtered_lines = []
-            for line in logs.split('\n'):
-                if level.upper() in line:
-                    filtered_lines.append(line)
-            logs = '\n'.join(filtered_lines)
+        # Tail in-process with a bounded read from the end of the file —
+        # no tail fork, no whole-file copy. Blocking I/O runs off-loop.
+        logs = await asyncio.to_thread(_tail_log_file, log_file, lines, level)
 
         return logs if logs else f"No {level} logs found in last {lines} lines"
 
@@ -413,15 +648,29 @@ async def redis_query(command: str) -> Any:
         cmd = parts[0].upper()
         args = parts[1:]
 
-        # Execute common commands
+        # Execute common commands — results are capped so one debug
+        # query can't block Redis or flood the MCP transport
+        cap = 1000
+
         if cmd == 'KEYS':
-            result = await r.keys(args[0] if args else '*')
+            # Cursor SCAN instead of KEYS: Redis serves it incrementally
+            # rather than freezing on a full keyspace walk
+            pattern = args[0] if args else '*'
+            result = []
+            async for key in r.scan_iter(match=pattern, count=500):
+                result.append(key)
+                if len(result) >= cap:
+                    result.append(f"... truncated at {cap} keys")
+                    break
         elif cmd == 'GET':
             result = await r.get(args[0])
         elif cmd == 'HGETALL':
             result = await r.hgetall(args[0])
+            if len(result) > cap:
+                result = dict(list(result.items())[:cap])
+                result['_truncated'] = f"showing {cap} fields"
         elif cmd == 'ZRANGE':
-            result = await r.zrange(args[0], 0, -1, withscores=True)
+            result = await r.zrange(args[0], 0, cap - 1, withscores=True)
         elif cmd == 'INFO':
             result = await r.info()
         else:
@@ -443,41 +692,28 @@ async def deploy_update() -> str:
     """
     try:
         # Check if we're in a git repo
-        result = subprocess.run(
-            ['git', 'rev-parse', '--git-dir'],
-            capture_output=True,
-            cwd=Path(__file__).parent.parent
-        )
-
-        if result.returncode != 0:
+        rc, _, _ = await _run_git('rev-parse', '--git-dir')
+        if rc != 0:
             return "⚠️  Not a git repository. Updates must be deployed manually."
 
         # Get current commit
-        current = subprocess.run(
-            ['git', 'rev-parse', '--short', 'HEAD'],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        ).stdout.strip()
+        _, current, _ = await _run_git('rev-parse', '--short', 'HEAD')
+
+        # Cheap remote probe first — the common case for auto-deploy
+        # checks is "nothing changed", which shouldn't pay a full
+        # fetch+merge or touch the working tree
+        _, local_head, _ = await _run_git('rev-parse', 'HEAD')
+        rc, remote_head, _ = await _run_git('ls-remote', 'origin', 'main')
+        if rc == 0 and remote_head and remote_head.split()[0] == local_head:
+            return f"✅ Already up to date (commit: {current})"
 
         # Pull latest
-        pull_result = subprocess.run(
-            ['git', 'pull', 'origin', 'main'],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
-
-        if pull_result.returncode != 0:
-            return f"❌ Git pull failed: {pull_result.stderr}"
+        rc, _, pull_err = await _run_git('pull', 'origin', 'main')
+        if rc != 0:
+            return f"❌ Git pull failed: {pull_err}"
 
         # Get new commit
-        new = subprocess.run(
-            ['git', 'rev-parse', '--short', 'HEAD'],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        ).stdout.strip()
+        _, new, _ = await _run_git('rev-parse', '--short', 'HEAD')
 
         if current == new:
             return f"✅ Already up to date (commit: {current})"
@@ -502,8 +738,16 @@ async def system_info() -> Dict[str, Any]:
     try:
         import psutil
 
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU usage — non-blocking after the first call. interval=None
+        # returns usage since the previous sample; only the first call
+        # (no baseline yet) pays a 1s sample, in a worker thread so the
+        # event loop keeps serving other tools.
+        global _cpu_primed
+        if _cpu_primed:
+            cpu_percent = psutil.cpu_percent(interval=None)
+        else:
+            cpu_percent = await asyncio.to_thread(psutil.cpu_percent, 1)
+            _cpu_primed = True
 
         # Memory usage
         memory = psutil.virtual_memory()
@@ -536,8 +780,7 @@ async def system_info() -> Dict[str, Any]:
 @mcp.resource("config://acheron/current")
 async def get_current_config() -> str:
     """Get current configuration as YAML"""
-    config = await get_config()
-    return yaml.safe_dump(config, default_flow_style=False)
+    return _load_yaml_cached(_CONFIG_PATH)[3]
 
 
 if __name__ == "__main__":
@@ -554,6 +797,9 @@ if __name__ == "__main__":
     # Create FastAPI app for HTTP transport
     app = FastAPI(title="Acheron MCP Server")
 
+    # Drain the Redis pool when uvicorn shuts down
+    app.add_event_handler("shutdown", close_redis)
+
     # Add health check endpoint
     @app.get("/health")
     async def health_check():
@@ -4,11 +4,30 @@ Sends push notifications via ntfy.sh for arbitrage alerts
 """
 
 import asyncio
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-from datetime import datetime
 import httpx
 from loguru import logger
 
+# Title emoji by profit margin, highest threshold first
+_TITLE_EMOJI = ((5.0, "🔥🔥"), (3.0, "🔥"), (0.0, "💰"))
+
+# 2-way alert body template — built once instead of re-assembling the
+# f-string (and stripping it) on every alert
+_MSG_2WAY = (
+    "🏒 {league}: {home_team} vs {away_team}\n"
+    "\n"
+    "💰 Profit: {profit}%\n"
+    "\n"
+    "Leg 1: {leg1_book} - {leg1_market} @ {leg1_odd}\n"
+    "Leg 2: {leg2_book} - {leg2_market} @ {leg2_odd}\n"
+    "\n"
+    "Implied Prob: {implied_prob}\n"
+    "\n"
+    "⚡ Act fast! Odds may move quickly."
+)
+
 
 class Notifier:
     """
@@ -21,7 +40,7 @@ class Notifier:
     - Retry logic with exponential backoff
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], http_client: Optional[httpx.AsyncClient] = None):
         self.config = config['notifications']
         self.ntfy_config = self.config['ntfy']
         self.thresholds = self.config['thresholds']
@@ -31,12 +50,35 @@ class Notifier:
         self.priority = self.ntfy_config.get('priority', 5)
         self.tags = self.ntfy_config.get('tags', 'moneybag,warning')
 
-        # Cooldown tracking
-        self.last_alert_time: Dict[str, float] = {}
+        # Built once — _send_ntfy only fills in the dynamic fields
+        self._ntfy_url = f"{self.server}/{self.topic}"
+        self._base_headers = {
+            "Priority": str(self.priority),
+            "Tags": self.tags,
+        }
+
+        # Cooldown tracking — LRU-capped so a long-running scraper that
+        # has alerted on thousands of events doesn't grow this forever
+        self.last_alert_time: OrderedDict[str, float] = OrderedDict()
         self.cooldown = self.thresholds.get('cooldown_seconds', 10)
 
-        # HTTP client
-        self.client = httpx.AsyncClient(timeout=10.0)
+        # Alerts fired within a short window are coalesced into one POST
+        # by a drain task (spawned lazily on first alert — __init__ may
+        # run outside the event loop)
+        self._alert_q: asyncio.Queue = asyncio.Queue(maxsize=64)
+        self._alert_task: Optional[asyncio.Task] = None
+
+        # HTTP client — injected shared client reuses the orchestrator's
+        # connection pool (no TLS handshake per alert); we only close a
+        # client we created ourselves. HTTP/2 + long keepalive lets a
+        # burst of alerts multiplex over one kept-alive connection.
+        self._owns_client = http_client is None
+        self.client = http_client or httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300.0),
+            headers={"User-Agent": "acheron/1.0"}
+        )
 
         logger.info(f"Notifier initialized. Topic: {self.topic}")
 
@@ -60,44 +102,49 @@ class Notifier:
             profit_pct = float(arb_data.get('profit_pct', 0))
 
             if profit_pct < self.thresholds['min_profit_percent']:
-                logger.debug(f"Arb profit {profit_pct}% below threshold, skipping alert")
+                logger.debug("Arb profit {}% below threshold, skipping alert", profit_pct)
                 return False
 
             # Check cooldown to prevent spam
             event_key = event_info.get('event_id', 'unknown')
             if self._is_cooldown_active(event_key):
-                logger.debug(f"Cooldown active for {event_key}, skipping alert")
+                logger.debug("Cooldown active for {}, skipping alert", event_key)
                 return False
 
-            # Build alert message
-            message = self._build_message(arb_data, event_info)
-            title = self._build_title(arb_data, event_info)
+            # Build alert message (profit_pct parsed once, above).
+            # Formatted here, not in the drain task — event_info may be
+            # a reused buffer upstream.
+            message = self._build_message(arb_data, event_info, profit_pct)
+            title = self._build_title(profit_pct, event_info)
             click_url = self._build_deep_link(event_info)
 
-            # Send notification
-            success = await self._send_ntfy(
-                title=title,
-                message=message,
-                click_url=click_url,
-                priority=self.priority,
-                tags=self.tags
-            )
-
-            if success:
-                self._update_cooldown(event_key)
-                logger.info(f"✅ Alert sent: {title}")
-            else:
-                logger.warning(f"⚠️  Failed to send alert: {title}")
+            # Hand off to the coalescer so a burst of arbs during a
+            # volatile odds swing costs one POST instead of N
+            if self._alert_task is None:
+                self._alert_task = asyncio.create_task(
+                    self._drain_alerts(), name='notifier-alert-drain'
+                )
+
+            try:
+                self._alert_q.put_nowait((title, message, click_url))
+            except asyncio.QueueFull:
+                logger.warning(f"⚠️  Alert queue full, dropping: {title}")
+                return False
 
-            return success
+            self._update_cooldown(event_key)
+            return True
 
         except Exception as e:
             logger.error(f"Error sending arbitrage alert: {e}")
             return False
 
-    def _build_message(self, arb_data: Dict[str, Any], event_info: Dict[str, Any]) -> str:
+    def _build_message(
+        self,
+        arb_data: Dict[str, Any],
+        event_info: Dict[str, Any],
+        profit: float
+    ) -> str:
         """Build notification message body"""
-        profit = arb_data.get('profit_pct', 0)
         arb_type = arb_data.get('type', '2-way')
 
         # Extract team names
@@ -110,39 +157,81 @@ class Notifier:
             leg1 = arb_data['leg1']
             leg2 = arb_data['leg2']
 
-            message = f"""
-🏒 {league}: {home_team} vs {away_team}
-
-💰 Profit: {profit}%
-
-Leg 1: {leg1['book'].upper()} - {leg1['market'].capitalize()} @ {leg1['odd']}
-Leg 2: {leg2['book'].upper()} - {leg2['market'].capitalize()} @ {leg2['odd']}
-
-Implied Prob: {arb_data.get('implied_prob', 'N/A')}
-
-⚡ Act fast! Odds may move quickly.
-""".strip()
-        else:
-            message = f"🏒 {league}: {home_team} vs {away_team}\n💰 3-Way Arb: {profit}%"
-
-        return message
-
-    def _build_title(self, arb_data: Dict[str, Any], event_info: Dict[str, Any]) -> str:
+            return _MSG_2WAY.format_map({
+                'league': league,
+                'home_team': home_team,
+                'away_team': away_team,
+                'profit': profit,
+                'leg1_book': leg1['book'].upper(),
+                'leg1_market': leg1['market'].capitalize(),
+                'leg1_odd': leg1['odd'],
+                'leg2_book': leg2['book'].upper(),
+                'leg2_market': leg2['market'].capitalize(),
+                'leg2_odd': leg2['odd'],
+                'implied_prob': arb_data.get('implied_prob', 'N/A'),
+            })
+
+        return f"🏒 {league}: {home_team} vs {away_team}\n💰 3-Way Arb: {profit}%"
+
+    def _build_title(self, profit: float, event_info: Dict[str, Any]) -> str:
         """Build notification title"""
-        profit = arb_data.get('profit_pct', 0)
         home_team = event_info.get('home_team', 'Home')
         away_team = event_info.get('away_team', 'Away')
 
-        # Emoji indicators based on profit margin
-        if float(profit) >= 5.0:
-            emoji = "🔥🔥"  # Hot arb
-        elif float(profit) >= 3.0:
-            emoji = "🔥"
-        else:
-            emoji = "💰"
+        # Emoji indicator based on profit margin (profit already a float)
+        emoji = _TITLE_EMOJI[-1][1]
+        for threshold, candidate in _TITLE_EMOJI:
+            if profit >= threshold:
+                emoji = candidate
+                break
 
         return f"{emoji} ARB: {profit}% | {home_team} vs {away_team}"
 
+    async def _drain_alerts(self):
+        """
+        Coalesce queued alerts into single POSTs
+
+        After the first alert arrives, waits 150ms for stragglers and
+        merges whatever accumulated into one notification
+        """
+        try:
+            while True:
+                items = [await self._alert_q.get()]
+
+                try:
+                    while len(items) < 10:
+                        items.append(
+                            await asyncio.wait_for(self._alert_q.get(), timeout=0.15)
+                        )
+                except asyncio.TimeoutError:
+                    pass
+
+                if len(items) == 1:
+                    title, message, click_url = items[0]
+                else:
+                    title = f"🔥 {len(items)} ARBS | " + items[0][0]
+                    message = "\n---\n".join(item[1] for item in items)
+                    click_url = items[0][2]
+
+                success = await self._send_ntfy(
+                    title=title,
+                    message=message,
+                    click_url=click_url,
+                    priority=self.priority,
+                    tags=self.tags
+                )
+
+                if success:
+                    logger.info(f"✅ Alert sent: {title}")
+                else:
+                    logger.warning(f"⚠️  Failed to send alert: {title}")
+
+                for _ in items:
+                    self._alert_q.task_done()
+
+        except asyncio.CancelledError:
+            logger.debug("Alert drain task cancelled")
+
     def _build_deep_link(self, event_info: Dict[str, Any]) -> str:
         """Build deep link to Pinnacle bet slip"""
         event_id = event_info.get('event_id')
@@ -155,17 +244,30 @@ Implied Prob: {arb_data.get('implied_prob', 'N/A')}
             # Fallback to NHL main page
             return "https://www.ps3838.com/sports/hockey/nhl"
 
+    # Hard cap on tracked events (LRU eviction beyond this)
+    _MAX_COOLDOWN_ENTRIES = 4096
+
     def _is_cooldown_active(self, event_key: str) -> bool:
         """Check if cooldown period is active for this event"""
-        if event_key not in self.last_alert_time:
+        ts = self.last_alert_time.get(event_key)
+        if ts is None:
+            return False
+
+        elapsed = time.monotonic() - ts
+        if elapsed > self.cooldown * 4:
+            # Long expired — drop it so the dict only tracks events
+            # alerted on recently
+            del self.last_alert_time[event_key]
             return False
 
-        elapsed = datetime.now().timestamp() - self.last_alert_time[event_key]
         return elapsed < self.cooldown
 
     def _update_cooldown(self, event_key: str):
-        """Update last alert time for cooldown tracking"""
-        self.last_alert_time[event_key] = datetime.now().timestamp()
+        """Update last alert time for cooldown tracking (LRU-capped)"""
+        self.last_alert_time[event_key] = time.monotonic()
+        self.last_alert_time.move_to_end(event_key)
+        while len(self.last_alert_time) > self._MAX_COOLDOWN_ENTRIES:
+            self.last_alert_time.popitem(last=False)
 
     async def _send_ntfy(
         self,
@@ -189,21 +291,19 @@ Implied Prob: {arb_data.get('implied_prob', 'N/A')}
             bool: Success status
         """
         try:
-            url = f"{self.server}/{self.topic}"
-
-            headers = {
-                "Title": title,
-                "Priority": str(priority),
-                "Tags": tags,
-            }
+            headers = {**self._base_headers, "Title": title}
 
+            if priority != self.priority:
+                headers["Priority"] = str(priority)
+            if tags != self.tags:
+                headers["Tags"] = tags
             if click_url:
                 headers["Click"] = click_url
 
-            # Send POST request
+            # Send POST request (content= skips httpx's form-encoding path)
             response = await self.client.post(
-                url,
-                data=message.encode('utf-8'),
+                self._ntfy_url,
+                content=message.encode('utf-8'),
                 headers=headers
             )
 
@@ -250,8 +350,16 @@ Implied Prob: {arb_data.get('implied_prob', 'N/A')}
         )
 
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Flush pending alerts and close the HTTP client (if we own it)"""
+        if self._alert_task:
+            try:
+                await asyncio.wait_for(self._alert_q.join(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out flushing alert queue")
+            self._alert_task.cancel()
+
+        if self._owns_client:
+            await self.client.aclose()
         logger.info("Notifier closed")
 
 
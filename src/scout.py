@@ -4,12 +4,27 @@ Handles stealth authentication, Cloudflare bypass, and cookie extraction
 """
 
 import asyncio
+import json
 import random
+import time
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime
 import nodriver as uc
 from loguru import logger
 
+# orjson for session snapshots when available — C serializer, bytes out
+try:
+    import orjson
+    _dumps = orjson.dumps  # returns bytes directly
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# Pre-sampled unit-interval randoms for human-like delays — drawn in one
+# batch at import and rescaled per use, so each delay costs a ring index
+# and a multiply instead of an RNG state step
+_DELAY_POOL = tuple(random.random() for _ in range(4096))
+
 
 class Scout:
     """
@@ -51,8 +66,24 @@ class Scout:
         self.session_duration = self.stealth_config['timing'].get('session_duration_min', 25) * 60
         self.last_auth_time: Optional[float] = None
 
+        # Proxy the browser was launched with (for breaker feedback)
+        self._auth_proxy: Optional[str] = None
+
+        # (monotonic timestamp, result) — validity checks arrive in
+        # bursts during reconnects; concurrent checkers share one answer
+        self._valid_cache: tuple = (0.0, False)
+
+        # Cursor into the pre-sampled delay ring (offset per instance so
+        # repeated fresh sessions don't replay the same timing sequence)
+        self._delay_idx = random.randrange(len(_DELAY_POOL))
+
         logger.info("Scout initialized")
 
+    def _rand_delay(self, lo: float, hi: float) -> float:
+        """Next pre-sampled delay rescaled into [lo, hi)"""
+        self._delay_idx = (self._delay_idx + 1) % len(_DELAY_POOL)
+        return lo + (hi - lo) * _DELAY_POOL[self._delay_idx]
+
     async def initialize(self):
         """Initialize browser and prepare for authentication"""
         try:
@@ -64,6 +95,7 @@ class Scout:
                 proxy_url = self.proxy_manager.get_proxy('authentication')
                 if proxy_url:
                     proxy = proxy_url
+                    self._auth_proxy = proxy_url
                     logger.info(f"Using proxy: {self.proxy_manager._mask_proxy_url(proxy_url)}")
 
             # Launch Nodriver browser
@@ -99,6 +131,42 @@ class Scout:
             logger.error(f"Failed to initialize browser: {e}")
             raise
 
+    async def _first_selector_index(self, selectors: List[str]) -> int:
+        """
+        Probe a selector list with one in-page querySelector batch
+
+        Sequential page.select calls pay a CDP round trip plus a full
+        timeout per missing selector (up to 2s each); one evaluate
+        checks the whole list in a single round trip.
+
+        Returns:
+            Index of the first matching selector, or -1 if none match
+        """
+        script = (
+            "(() => { const sels = %s; "
+            "return sels.findIndex(s => document.querySelector(s)); })()"
+            % json.dumps(selectors)
+        )
+
+        try:
+            idx = await self.page.evaluate(script)
+            return int(idx) if idx is not None else -1
+        except Exception as e:
+            logger.debug(f"Selector probe failed: {e}")
+            return -1
+
+    async def _find_first_selector(self, selectors: List[str], timeout: float = 2):
+        """Get an element handle for the first matching selector (or None)"""
+        idx = await self._first_selector_index(selectors)
+        if idx < 0:
+            return None
+
+        try:
+            # One select() for the known-present selector to get a handle
+            return await self.page.select(selectors[idx], timeout=timeout)
+        except Exception:
+            return None
+
     async def authenticate(self) -> bool:
         """
         Perform authentication and extract session data
@@ -111,7 +179,7 @@ class Scout:
 
             # Navigate to login page
             await self.page.get(f"{self.base_url}/en/login")
-            await asyncio.sleep(random.uniform(2, 4))  # Human-like delay
+            await asyncio.sleep(self._rand_delay(2, 4))  # Human-like delay
 
             # Wait for page load and check for Cloudflare
             await self._handle_cloudflare_if_present()
@@ -133,16 +201,23 @@ class Scout:
             await self._discover_websocket_endpoint()
 
             # Mark authentication time
-            self.last_auth_time = datetime.now().timestamp()
+            self.last_auth_time = time.time()
             self.session_data['expires_at'] = self.last_auth_time + self.session_duration
+            self._valid_cache = (0.0, False)  # drop any stale "invalid" answer
 
             logger.info("✅ Authentication successful!")
             logger.info(f"Session expires at: {datetime.fromtimestamp(self.session_data['expires_at'])}")
 
+            # Close the proxy's breaker circuit on a confirmed good auth
+            if self.proxy_manager and self._auth_proxy:
+                self.proxy_manager.mark_proxy_success(self._auth_proxy)
+
             return True
 
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
+            if self.proxy_manager and self._auth_proxy:
+                self.proxy_manager.mark_proxy_failed(self._auth_proxy)
             return False
 
     async def _handle_cloudflare_if_present(self):
@@ -162,27 +237,40 @@ class Scout:
                 '[data-sitekey]'  # Turnstile widget
             ]
 
-            for selector in cloudflare_selectors:
-                try:
-                    element = await self.page.select(selector, timeout=2)
-                    if element:
-                        logger.info("🔒 Cloudflare Turnstile detected, waiting for bypass...")
-
-                        # Nodriver should handle this automatically
-                        # Wait for challenge to complete
-                        await asyncio.sleep(5)
+            if await self._first_selector_index(cloudflare_selectors) >= 0:
+                logger.info("🔒 Cloudflare Turnstile detected, waiting for bypass...")
 
-                        # Check if still on challenge page
-                        current_url = self.page.url
-                        if 'challenge' in current_url.lower():
-                            logger.warning("Still on challenge page, waiting longer...")
-                            await asyncio.sleep(10)
+                # Nodriver handles the solve automatically. Rather than a
+                # blind sleep, wake on the navigation the solve triggers —
+                # the challenge usually clears in well under 2s
+                navigated = asyncio.Event()
 
-                        logger.info("✅ Cloudflare challenge completed")
-                        return
+                def _on_navigated(event):
+                    navigated.set()
 
-                except Exception:
-                    continue  # Selector not found, try next
+                self.page.add_handler(uc.cdp.page.FrameNavigated, _on_navigated)
+                try:
+                    deadline = time.monotonic() + 15
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            logger.warning("Cloudflare wait timed out, continuing anyway")
+                            break
+                        try:
+                            await asyncio.wait_for(navigated.wait(), timeout=remaining)
+                        except asyncio.TimeoutError:
+                            logger.warning("Cloudflare wait timed out, continuing anyway")
+                            break
+                        if 'challenge' not in self.page.url.lower():
+                            break
+                        # Challenge frame navigated; keep waiting for the
+                        # real page within the same deadline
+                        navigated.clear()
+                finally:
+                    self.page.handlers[uc.cdp.page.FrameNavigated].remove(_on_navigated)
+
+                logger.info("✅ Cloudflare challenge completed")
+                return
 
             logger.info("No Cloudflare challenge detected")
 
@@ -203,14 +291,7 @@ class Scout:
                 'input[autocomplete="username"]'
             ]
 
-            username_field = None
-            for selector in username_selectors:
-                try:
-                    username_field = await self.page.select(selector, timeout=2)
-                    if username_field:
-                        break
-                except:
-                    continue
+            username_field = await self._find_first_selector(username_selectors)
 
             if not username_field:
                 logger.error("Could not find username field")
@@ -223,14 +304,7 @@ class Scout:
                 'input[type="password"]'
             ]
 
-            password_field = None
-            for selector in password_selectors:
-                try:
-                    password_field = await self.page.select(selector, timeout=2)
-                    if password_field:
-                        break
-                except:
-                    continue
+            password_field = await self._find_first_selector(password_selectors)
 
             if not password_field:
                 logger.error("Could not find password field")
@@ -241,15 +315,15 @@ class Scout:
 
             # Type username
             await username_field.click()
-            await asyncio.sleep(random.uniform(0.1, 0.3))
+            await asyncio.sleep(self._rand_delay(0.1, 0.3))
             await username_field.send_keys(self.username)
-            await asyncio.sleep(random.uniform(0.5, 1.0))
+            await asyncio.sleep(self._rand_delay(0.5, 1.0))
 
             # Type password
             await password_field.click()
-            await asyncio.sleep(random.uniform(0.1, 0.3))
+            await asyncio.sleep(self._rand_delay(0.1, 0.3))
             await password_field.send_keys(self.password)
-            await asyncio.sleep(random.uniform(0.5, 1.0))
+            await asyncio.sleep(self._rand_delay(0.5, 1.0))
 
             # Find and click submit button
             submit_selectors = [
@@ -260,14 +334,7 @@ class Scout:
                 '[data-action="login"]'
             ]
 
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    submit_button = await self.page.select(selector, timeout=2)
-                    if submit_button:
-                        break
-                except:
-                    continue
+            submit_button = await self._find_first_selector(submit_selectors)
 
             if submit_button:
                 logger.info("Submitting login form...")
@@ -288,34 +355,42 @@ class Scout:
         try:
             logger.info("Extracting session data...")
 
-            # Get all cookies
+            # Get all cookies (one CDP call for every context)
             cookies = await self.browser.cookies.get_all()
 
-            # Format cookies for HTTP requests
-            cookie_dict = {}
-            for cookie in cookies:
-                cookie_dict[cookie.name] = cookie.value
-
+            # Format cookies for HTTP requests — comprehension runs the
+            # whole build at C level instead of per-item bytecode
+            cookie_dict = {cookie.name: cookie.value for cookie in cookies}
             self.session_data['cookies'] = cookie_dict
 
             # Look for important cookies
-            important_cookies = ['cf_clearance', 'ASP.NET_SessionId', 'auth_token', 'session']
-            found_cookies = [name for name in important_cookies if name in cookie_dict]
+            important_cookies = {'cf_clearance', 'ASP.NET_SessionId', 'auth_token', 'session'}
+            found_cookies = sorted(important_cookies.intersection(cookie_dict))
 
             logger.info(f"Extracted {len(cookie_dict)} cookies, including: {found_cookies}")
 
-            # Extract User-Agent
-            user_agent = await self.page.evaluate('navigator.userAgent')
-            self.session_data['user_agent'] = user_agent
+            # Extract User-Agent and auth token in one evaluate — each
+            # separate call is a full CDP round trip (~5-15ms)
+            blob = await self.page.evaluate(
+                '(() => {'
+                ' let auth = null;'
+                ' try {'
+                '  auth = localStorage.getItem("authToken") || localStorage.getItem("token");'
+                ' } catch (e) {}'
+                ' return JSON.stringify({ua: navigator.userAgent, auth: auth});'
+                '})()'
+            )
 
-            # Try to extract auth token from localStorage or cookies
             try:
-                auth_token = await self.page.evaluate('localStorage.getItem("authToken") || localStorage.getItem("token")')
-                if auth_token:
-                    self.session_data['auth_token'] = auth_token
-                    logger.info("✅ Auth token extracted from localStorage")
-            except:
-                pass
+                extracted = json.loads(blob) if isinstance(blob, str) else {}
+            except ValueError:
+                extracted = {}
+
+            self.session_data['user_agent'] = extracted.get('ua')
+
+            if extracted.get('auth'):
+                self.session_data['auth_token'] = extracted['auth']
+                logger.info("✅ Auth token extracted from localStorage")
 
         except Exception as e:
             logger.error(f"Error extracting session data: {e}")
@@ -376,21 +451,30 @@ class Scout:
         """Get current session data"""
         return self.session_data.copy()
 
+    def get_session_data_bytes(self) -> bytes:
+        """Serialize session data for persistence or IPC (orjson-backed)"""
+        return _dumps(self.session_data)
+
     def is_session_valid(self) -> bool:
-        """Check if current session is still valid"""
-        if not self.session_data['cookies'] or not self.last_auth_time:
-            return False
+        """Check if current session is still valid (memoized for 1s)"""
+        now_mono = time.monotonic()
+        ts, cached = self._valid_cache
+        if now_mono - ts < 1.0:
+            return cached
 
-        # Check if session has expired
-        if self.session_data['expires_at']:
-            return datetime.now().timestamp() < self.session_data['expires_at']
+        valid = False
+        if self.session_data['cookies'] and self.last_auth_time:
+            # Check if session has expired
+            if self.session_data['expires_at']:
+                valid = time.time() < self.session_data['expires_at']
 
-        return False
+        self._valid_cache = (now_mono, valid)
+        return valid
 
     def time_until_expiry(self) -> Optional[float]:
         """Get seconds until session expires"""
         if self.session_data['expires_at']:
-            return max(0, self.session_data['expires_at'] - datetime.now().timestamp())
+            return max(0, self.session_data['expires_at'] - time.time())
         return None
 
     async def refresh_session_if_needed(self) -> bool:
@@ -402,7 +486,7 @@ class Scout:
         """
         if self.is_session_valid():
             time_left = self.time_until_expiry()
-            logger.debug(f"Session still valid ({time_left:.0f}s remaining)")
+            logger.debug("Session still valid ({:.0f}s remaining)", time_left)
             return True
 
         logger.info("Session expired or invalid, re-authenticating...")